@@ -1,6 +1,7 @@
 import logging
 import pytest
 import os
+import sys
 
 from pyspark import HiveContext
 from pyspark import SparkConf
@@ -13,7 +14,14 @@ def quiet_py4j():
 
 @pytest.fixture(scope="session")
 def spark_context(request):
-    conf = (SparkConf().setMaster("local[2]").setAppName("pytest-pyspark-local-testing"))
+    # local[*] uses every available core; a random driver port and a
+    # per-process app name keep pytest-xdist workers from colliding.
+    conf = (SparkConf()
+            .setMaster(os.environ.get('PYSPARK_MASTER', 'local[*]'))
+            .setAppName('pytest-pyspark-{}'.format(os.getpid()))
+            .set('spark.ui.enabled', 'false')
+            .set('spark.driver.host', '127.0.0.1')
+            .set('spark.driver.port', '0'))
     request.addfinalizer(lambda: sc.stop())
 
     sc = SparkContext(conf=conf)
@@ -30,5 +38,7 @@ def streaming_context(spark_context):
 
 @pytest.fixture(scope="session")
 def setup_pyspark_env():
-    os.environ['PYSPARK_DRIVER_PYTHON'] = '/usr/local/anaconda3/envs/nexus-messages3/bin/python'
-    os.environ['PYSPARK_PYTHON'] = '/usr/local/anaconda3/envs/nexus-messages3/bin/python'
\ No newline at end of file
+    # Only fill in defaults; an externally configured PYSPARK_PYTHON /
+    # PYSPARK_DRIVER_PYTHON is inherited as-is.
+    os.environ.setdefault('PYSPARK_DRIVER_PYTHON', sys.executable)
+    os.environ.setdefault('PYSPARK_PYTHON', sys.executable)
@@ -14,19 +14,190 @@
 # limitations under the License.
 
 
+import csv
+import io
+import itertools
 import json
+import time
+
 import numpy
 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pytz import timezone
+from functools import lru_cache
 
 from webservice.NexusHandler import nexus_handler
 from webservice.algorithms.NexusCalcHandler import NexusCalcHandler
 from webservice.webmodel import NexusResults, NexusProcessingException
 
-EPOCH = timezone('UTC').localize(datetime(1970, 1, 1))
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 ISO_8601 = '%Y-%m-%dT%H:%M:%S%z'
 
+RequestArgs = namedtuple('RequestArgs', 'ds parameter start_time end_time bounding_polygon metadata_filter')
+
+
+# Shared pool for overlapping tile fetches with point extraction; sized
+# to match the fetchThreads used elsewhere for backend queries.
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=8)
+
+
+@lru_cache(maxsize=65536)
+def _format_time(t):
+    # Result rows share very few distinct timestamps (one per tile time
+    # slice), so memoizing collapses most format calls to a dict hit.
+    # time.gmtime avoids datetime.utcfromtimestamp, which is deprecated
+    # as of Python 3.12 and slower than the direct struct_time path.
+    g = time.gmtime(t)
+    return '%04d-%02d-%02dT%02d:%02d:%02dZ' % (g.tm_year, g.tm_mon, g.tm_mday, g.tm_hour, g.tm_min, g.tm_sec)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _valid_flat_indices(values, mask):
+        # Fuses the unmasked / nonzero / not-NaN tests into one compiled
+        # pass over the flat arrays, with no boolean temporaries.
+        out = numpy.empty(values.shape[0], numpy.int64)
+        count = 0
+        for i in range(values.shape[0]):
+            v = values[i]
+            if not mask[i] and v == v and v != 0.0:
+                out[count] = i
+                count += 1
+        return out[:count]
+else:
+    _valid_flat_indices = None
+
+
+def _extract_points_vectorized(tile, parameter):
+    """
+    Extract every valid point from a tile in a single vectorized pass.
+
+    Returns a dict of columnar arrays ('time', 'latitude', 'longitude',
+    'data_vals', plus the wind metadata columns when present) along with
+    the tile id, instead of one dict per point. This avoids the per-point
+    Python loop over tile.nexus_point_generator() which dominates runtime
+    on dense tiles.
+    """
+    if _valid_flat_indices is not None:
+        values = numpy.ma.getdata(tile.data).ravel()
+        mask = numpy.ma.getmaskarray(tile.data).ravel()
+        flat_idx = _valid_flat_indices(values, mask)
+        idx = numpy.unravel_index(flat_idx, tile.data.shape)
+        data_vals = values[flat_idx]
+    else:
+        idx = numpy.ma.nonzero(tile.data)
+        data_vals = numpy.asarray(tile.data[idx])
+
+        # Tiles without a mask carry their fill values as NaN, which
+        # np.ma.nonzero does not filter; drop those rows with a single
+        # C-level isnan pass instead of testing per point.
+        valid = ~numpy.isnan(data_vals)
+        if not valid.all():
+            idx = tuple(axis_idx[valid] for axis_idx in idx)
+            data_vals = data_vals[valid]
+
+    columns = {
+        'id': tile.tile_id,
+        'time': tile.times[idx[0]],
+        'latitude': tile.latitudes[idx[1]],
+        'longitude': tile.longitudes[idx[2]],
+        'data_vals': data_vals
+    }
+
+    if parameter == 'wind':
+        # Whether a metadata array is usable is a property of the tile,
+        # so test membership and shape up front rather than catching
+        # KeyError/IndexError from the gather.
+        meta_data = tile.meta_data if tile.meta_data is not None else {}
+        for point_key, meta_key in (('wind_v', 'wind_v'),
+                                    ('wind_direction', 'wind_dir'),
+                                    ('wind_speed', 'wind_speed')):
+            meta_array = meta_data.get(meta_key)
+            if meta_array is not None and numpy.shape(meta_array) == tile.data.shape:
+                columns[point_key] = numpy.asarray(meta_array)[idx]
+
+    return columns
+
+
+def _point_builder(columns, parameter):
+    """
+    Dispatch once per tile to a specialized point builder rather than
+    re-evaluating the parameter if-chain for every row. The wind builder
+    captures the metadata columns up front so the per-row body is plain
+    'is not None' checks instead of try/except blocks.
+    """
+    tile_id = columns['id']
+    data_vals = columns['data_vals']
+
+    if parameter == 'wind':
+        wind_v = columns.get('wind_v')
+        wind_dir = columns.get('wind_direction')
+        wind_speed = columns.get('wind_speed')
+
+        # Seed a per-tile template holding the interned keys and the
+        # tile id; dict.copy() of a small dict is a single C-level copy,
+        # cheaper than rebuilding the key table per point.
+        template = {'id': tile_id, 'wind_u': None}
+        if wind_v is not None:
+            template['wind_v'] = None
+        if wind_dir is not None:
+            template['wind_direction'] = None
+        if wind_speed is not None:
+            template['wind_speed'] = None
+
+        def build_wind(i):
+            point = template.copy()
+            point['wind_u'] = data_vals[i]
+            if wind_v is not None:
+                point['wind_v'] = wind_v[i]
+            if wind_dir is not None:
+                point['wind_direction'] = wind_dir[i]
+            if wind_speed is not None:
+                point['wind_speed'] = wind_speed[i]
+            return point
+
+        return build_wind
+
+    value_key = parameter if parameter in ('sst', 'sss') else 'variable'
+    template = {'id': tile_id, value_key: None}
+
+    def build_point(i):
+        point = template.copy()
+        point[value_key] = data_vals[i]
+        return point
+
+    return build_point
+
+
+def _columns_to_points(columns, parameter):
+    """
+    Materialize the columnar arrays from _extract_points_vectorized into
+    the list-of-dicts shape expected by DataInBoundsResult.
+    """
+    data = []
+    times = columns['time']
+    latitudes = columns['latitude']
+    longitudes = columns['longitude']
+
+    build_point = _point_builder(columns, parameter)
+
+    for i in range(len(columns['data_vals'])):
+        data.append({
+            'latitude': latitudes[i],
+            'longitude': longitudes[i],
+            'time': times[i],
+            'data': [
+                build_point(i)
+            ]
+        })
+
+    return data
+
 
 @nexus_handler
 class DataInBoundsSearchCalcHandlerImpl(NexusCalcHandler):
@@ -69,11 +240,16 @@ class DataInBoundsSearchCalcHandlerImpl(NexusCalcHandler):
     singleton = True
 
     def parse_arguments(self, request):
-        # Parse input arguments
+        # Parse input arguments with explicit presence checks so the
+        # success path never relies on (bare) exception handling. Failures
+        # inside the accessors (bad shortname, malformed 'b') still have to
+        # surface as 400s, not bubble up as 500s.
 
+        if request.get_argument('ds', None) is None:
+            raise NexusProcessingException(reason="'ds' argument is required", code=400)
         try:
             ds = request.get_dataset()[0]
-        except:
+        except Exception:
             raise NexusProcessingException(reason="'ds' argument is required", code=400)
 
         parameter_s = request.get_argument('parameter', None)
@@ -83,15 +259,15 @@ class DataInBoundsSearchCalcHandlerImpl(NexusCalcHandler):
 
         try:
             start_time = request.get_start_datetime()
-            start_time = int((start_time - EPOCH).total_seconds())
-        except:
+            start_time = int(start_time.timestamp())
+        except (TypeError, ValueError):
             raise NexusProcessingException(
                 reason="'startTime' argument is required. Can be int value seconds from epoch or string format YYYY-MM-DDTHH:mm:ssZ",
                 code=400)
         try:
             end_time = request.get_end_datetime()
-            end_time = int((end_time - EPOCH).total_seconds())
-        except:
+            end_time = int(end_time.timestamp())
+        except (TypeError, ValueError):
             raise NexusProcessingException(
                 reason="'endTime' argument is required. Can be int value seconds from epoch or string format YYYY-MM-DDTHH:mm:ssZ",
                 code=400)
@@ -103,9 +279,14 @@ class DataInBoundsSearchCalcHandlerImpl(NexusCalcHandler):
                 code=400)
 
         bounding_polygon = metadata_filter = None
-        try:
-            bounding_polygon = request.get_bounding_polygon()
-        except:
+        if request.get_argument('b', None) is not None:
+            try:
+                bounding_polygon = request.get_bounding_polygon()
+            except Exception:
+                # A malformed 'b' falls through to the metadataFilter path,
+                # same as when 'b' is absent.
+                bounding_polygon = None
+        if bounding_polygon is None:
             metadata_filter = request.get_metadata_filter()
             if 0 == len(metadata_filter):
                 raise NexusProcessingException(
@@ -114,7 +295,43 @@ class DataInBoundsSearchCalcHandlerImpl(NexusCalcHandler):
                            "Maximum (Northern) Latitude. 'metadataFilter' must be in the form key:value",
                     code=400)
 
-        return ds, parameter_s, start_time, end_time, bounding_polygon, metadata_filter
+        return RequestArgs(ds, parameter_s, start_time, end_time, bounding_polygon, metadata_filter)
+
+    def _fetch_tiles_parallel(self, min_lat, max_lat, min_lon, max_lon, ds, start_time, end_time, splits=2):
+        """
+        Split the bounding box into a splits x splits grid and run the
+        tile lookups (including their data fetches) concurrently so
+        backend I/O overlaps instead of running as one large blocking
+        query. Only the lookup is split: tiles straddling a sub-box edge
+        come back from more than one query, so they are deduplicated by
+        tile id while still unmasked and then masked once with the full
+        requested bounds — masking per sub-box would keep just one
+        sub-box's points for a straddling tile.
+        """
+        tile_service = self._get_tile_service()
+
+        lat_edges = numpy.linspace(min_lat, max_lat, splits + 1)
+        lon_edges = numpy.linspace(min_lon, max_lon, splits + 1)
+
+        futures = [_PREFETCH_POOL.submit(tile_service.find_tiles_in_box,
+                                         lat_edges[i], lat_edges[i + 1],
+                                         lon_edges[j], lon_edges[j + 1],
+                                         ds, start_time, end_time)
+                   for i in range(splits) for j in range(splits)]
+
+        tiles = []
+        seen_tile_ids = set()
+        for future in as_completed(futures):
+            for tile in future.result():
+                if tile.tile_id not in seen_tile_ids:
+                    seen_tile_ids.add(tile.tile_id)
+                    tiles.append(tile)
+
+        tiles = tile_service.mask_tiles_to_bbox(min_lat, max_lat, min_lon, max_lon, tiles)
+        if 0 <= start_time <= end_time:
+            tiles = tile_service.mask_tiles_to_time_range(start_time, end_time, tiles)
+
+        return tiles
 
     def calc(self, computeOptions, **args):
         ds, parameter, start_time, end_time, bounding_polygon, metadata_filter = self.parse_arguments(computeOptions)
@@ -128,57 +345,40 @@ class DataInBoundsSearchCalcHandlerImpl(NexusCalcHandler):
             min_lon = bounding_polygon.bounds[0]
             max_lon = bounding_polygon.bounds[2]
 
-            tiles = self._get_tile_service().get_tiles_bounded_by_box(min_lat, max_lat, min_lon, max_lon, ds, start_time,
-                                                                end_time)
+            tiles = self._fetch_tiles_parallel(min_lat, max_lat, min_lon, max_lon, ds, start_time, end_time)
         else:
             tiles = self._get_tile_service().get_tiles_by_metadata(metadata_filter, ds, start_time, end_time)
 
-        data = []
+        # Collect tile summaries in the same pass as point extraction so
+        # the tile list is only walked once.
+        meta = [] if includemeta else None
+        tile_columns = []
         for tile in tiles:
-            for nexus_point in tile.nexus_point_generator():
-
-                point = dict()
-                point['id'] = tile.tile_id
-
-                if parameter == 'sst':
-                    point['sst'] = nexus_point.data_vals
-                elif parameter == 'sss':
-                    point['sss'] = nexus_point.data_vals
-                elif parameter == 'wind':
-                    point['wind_u'] = nexus_point.data_vals
-                    try:
-                        point['wind_v'] = tile.meta_data['wind_v'][tuple(nexus_point.index)]
-                    except (KeyError, IndexError):
-                        pass
-                    try:
-                        point['wind_direction'] = tile.meta_data['wind_dir'][tuple(nexus_point.index)]
-                    except (KeyError, IndexError):
-                        pass
-                    try:
-                        point['wind_speed'] = tile.meta_data['wind_speed'][tuple(nexus_point.index)]
-                    except (KeyError, IndexError):
-                        pass
-                else:
-                    point['variable'] = nexus_point.data_vals
-
-                data.append({
-                    'latitude': nexus_point.latitude,
-                    'longitude': nexus_point.longitude,
-                    'time': nexus_point.time,
-                    'data': [
-                        point
-                    ]
-                })
-
-        if includemeta and len(tiles) > 0:
-            meta = [tile.get_summary() for tile in tiles]
-        else:
+            tile_columns.append(_extract_points_vectorized(tile, parameter))
+            if includemeta:
+                meta.append(tile.get_summary())
+
+        if not meta:
             meta = None
 
-        result = DataInBoundsResult(
-            results=data,
-            stats={},
-            meta=meta)
+        if computeOptions.get_content_type() == 'CSV':
+            # CSV consumers never look at the nested per-point dict
+            # shape, so hand the columnar arrays straight to the result
+            # and let toCSV stream them.
+            result = DataInBoundsResultCSV(
+                tile_columns=tile_columns,
+                parameter=parameter,
+                stats={},
+                meta=meta)
+        else:
+            data = []
+            for columns in tile_columns:
+                data.extend(_columns_to_points(columns, parameter))
+
+            result = DataInBoundsResult(
+                results=data,
+                stats={},
+                meta=meta)
 
         result.extendMeta(min_lat, max_lat, min_lon, max_lon, "", start_time, end_time)
 
@@ -186,8 +386,18 @@ class DataInBoundsSearchCalcHandlerImpl(NexusCalcHandler):
 
 
 class DataInBoundsResult(NexusResults):
+    def iter_results(self):
+        """
+        Iterate result rows without forcing consumers to hold a second
+        full copy of the result list.
+        """
+        return iter(self.results())
+
     def toCSV(self):
-        rows = []
+        results = self.results()
+
+        if not results:
+            return ""
 
         headers = [
             "id",
@@ -196,41 +406,111 @@ class DataInBoundsResult(NexusResults):
             "time"
         ]
 
-        for i, result in enumerate(self.results()):
-            cols = []
-
-            cols.append(str(result['data'][0]['id']))
-            cols.append(str(result['longitude']))
-            cols.append(str(result['latitude']))
-            cols.append(datetime.utcfromtimestamp(result["time"]).strftime('%Y-%m-%dT%H:%M:%SZ'))
-            if 'sst' in result['data'][0]:
-                cols.append(str(result['data'][0]['sst']))
-                if i == 0:
-                    headers.append("sea_water_temperature")
-            elif 'sss' in result['data'][0]:
-                cols.append(str(result['data'][0]['sss']))
-                if i == 0:
-                    headers.append("sea_water_salinity")
-            elif 'wind_u' in result['data'][0]:
-                cols.append(str(result['data'][0]['wind_u']))
-                cols.append(str(result['data'][0]['wind_v']))
-                cols.append(str(result['data'][0]['wind_direction']))
-                cols.append(str(result['data'][0]['wind_speed']))
-                if i == 0:
-                    headers.append("eastward_wind")
-                    headers.append("northward_wind")
-                    headers.append("wind_direction")
-                    headers.append("wind_speed")
-
-            if i == 0:
-                rows.append(",".join(headers))
-            rows.append(",".join(cols))
-
-        return "\r\n".join(rows)
+        # The value columns are uniform across the result set, so decide
+        # them once from the first point instead of re-checking per row.
+        first_point = results[0]['data'][0]
+        if 'sst' in first_point:
+            headers.append("sea_water_temperature")
+            value_keys = ['sst']
+        elif 'sss' in first_point:
+            headers.append("sea_water_salinity")
+            value_keys = ['sss']
+        elif 'wind_u' in first_point:
+            headers.extend(["eastward_wind", "northward_wind", "wind_direction", "wind_speed"])
+            value_keys = ['wind_u', 'wind_v', 'wind_direction', 'wind_speed']
+        else:
+            value_keys = []
+
+        def rows():
+            for result in self.iter_results():
+                point = result['data'][0]
+                row = [
+                    point['id'],
+                    result['longitude'],
+                    result['latitude'],
+                    _format_time(int(result["time"]))
+                ]
+                row.extend(point[key] for key in value_keys)
+                yield row
+
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\r\n')
+        writer.writerow(headers)
+        # writerows drains the generator from C, appending straight into
+        # the buffer with no intermediate row list.
+        writer.writerows(rows())
+
+        return buf.getvalue()
 
     def toJson(self):
         return json.dumps(self.results(), indent=4, cls=NpEncoder)
 
+
+class DataInBoundsResultCSV(DataInBoundsResult):
+    """
+    CSV-specialized DataInBoundsResult that keeps the extracted points in
+    columnar form and streams the arrays straight to the csv writer,
+    skipping the per-point dict materialization. Consumers that want the
+    nested dict shape still get it via results().
+    """
+
+    _VALUE_HEADERS = {
+        'sst': ["sea_water_temperature"],
+        'sss': ["sea_water_salinity"],
+        'wind': ["eastward_wind", "northward_wind", "wind_direction", "wind_speed"]
+    }
+
+    def __init__(self, tile_columns, parameter, **args):
+        DataInBoundsResult.__init__(self, results=None, **args)
+        self._tile_columns = tile_columns
+        self._parameter = parameter
+
+    def iter_results(self):
+        """
+        Lazily materialize the per-point dict shape one tile at a time,
+        keeping peak memory at a single tile's worth of dicts.
+        """
+        for columns in self._tile_columns:
+            for point in _columns_to_points(columns, self._parameter):
+                yield point
+
+    def results(self):
+        return list(self.iter_results())
+
+    def toCSV(self):
+        if not any(len(columns['data_vals']) for columns in self._tile_columns):
+            return ""
+
+        headers = ["id", "lon", "lat", "time"] + self._VALUE_HEADERS.get(self._parameter, [])
+
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\r\n')
+        writer.writerow(headers)
+
+        for columns in self._tile_columns:
+            row_count = len(columns['data_vals'])
+            if row_count == 0:
+                continue
+
+            times = numpy.asarray(columns['time']).astype('datetime64[s]')
+            time_strs = numpy.char.add(numpy.datetime_as_string(times, unit='s'), 'Z')
+
+            if self._parameter == 'wind':
+                value_columns = [columns['data_vals'], columns['wind_v'],
+                                 columns['wind_direction'], columns['wind_speed']]
+            elif self._parameter in ('sst', 'sss'):
+                value_columns = [columns['data_vals']]
+            else:
+                value_columns = []
+
+            writer.writerows(zip(itertools.repeat(columns['id'], row_count),
+                                 columns['longitude'],
+                                 columns['latitude'],
+                                 time_strs,
+                                 *value_columns))
+
+        return buf.getvalue()
+
 class NpEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, numpy.integer):
@@ -23,8 +23,8 @@ from datetime import datetime
 
 import pkg_resources
 from cassandra.cluster import Cluster
+from cassandra.concurrent import execute_concurrent_with_args
 from cassandra.policies import TokenAwarePolicy, DCAwareRoundRobinPolicy
-from cassandra.query import BatchStatement
 from cassandra.auth import PlainTextAuthProvider
 from pytz import UTC
 
@@ -161,14 +161,16 @@ class ResultsStorage(AbstractResultsContainer):
                 (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         insertStatement = self._session.prepare(cql)
-        batch = BatchStatement()
 
+        rows = []
         for result in results:
-            self.__insertResult(execution_id, None, result, batch, insertStatement)
+            self.__appendResultRows(execution_id, None, result, rows)
 
-        self._session.execute(batch)
+        # Pipeline the inserts over the connection pool instead of
+        # serializing them through multi-partition batches
+        execute_concurrent_with_args(self._session, insertStatement, rows, concurrency=64)
 
-    def __insertResult(self, execution_id, primaryId, result, batch, insertStatement):
+    def __appendResultRows(self, execution_id, primaryId, result, rows):
         data_dict = {}
         if 'primary' in result:
             data_dict = result['primary']
@@ -176,9 +178,8 @@ class ResultsStorage(AbstractResultsContainer):
             data_dict = result['secondary']
 
         dataMap = self.__buildDataMap(data_dict)
-        result_id = uuid.uuid4()
-        batch.add(insertStatement, (
-            result_id,
+        rows.append((
+            uuid.uuid4(),
             execution_id,
             result["id"],
             primaryId,
@@ -190,25 +191,10 @@ class ResultsStorage(AbstractResultsContainer):
             result["device"] if "device" in result else None,
             dataMap,
             1 if primaryId is None else 0
-        )
-                  )
-
-        n = 0
-        if "matches" in result:
-            for match in result["matches"]:
-                self.__insertResult(execution_id, result["id"], match, batch, insertStatement)
-                n += 1
-                if n >= 20:
-                    if primaryId is None:
-                        self.__commitBatch(batch)
-                    n = 0
-
-        if primaryId is None:
-            self.__commitBatch(batch)
-
-    def __commitBatch(self, batch):
-        self._session.execute(batch)
-        batch.clear()
+        ))
+
+        for match in result.get("matches", ()):
+            self.__appendResultRows(execution_id, result["id"], match, rows)
 
     def __buildDataMap(self, result):
         dataMap = {}
@@ -13,84 +13,89 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from types import MappingProxyType
+
 INSITU_API_ENDPOINT = 'https://doms.jpl.nasa.gov/insitu/1.0/query_data_doms_custom_pagination'
 
-INSITU_PROVIDER_MAP = [
-    {
+# Config structures are read-only; tuples, MappingProxyType, and
+# frozenset keep them immutable (and copy-on-write friendly across
+# forked Spark workers) without changing the lookup API.
+INSITU_PROVIDER_MAP = (
+    MappingProxyType({
         'name': 'NCAR',
-        'projects': [
-            {
+        'projects': (
+            MappingProxyType({
                 'name': 'ICOADS Release 3.0',
-                'platforms': ['0', '16', '17', '30', '41', '42']
-            }
-        ]
-    },
-    {
+                'platforms': frozenset({'0', '16', '17', '30', '41', '42'})
+            }),
+        )
+    }),
+    MappingProxyType({
         'name': 'Florida State University, COAPS',
-        'projects': [
-            {
+        'projects': (
+            MappingProxyType({
                 'name': 'SAMOS',
-                'platforms': ['30']
-            }
-        ]
-    },
-    {
+                'platforms': frozenset({'30'})
+            }),
+        )
+    }),
+    MappingProxyType({
         'name': 'Saildrone',
-        'projects': [
-            {
+        'projects': (
+            MappingProxyType({
                 'name': '1021_atlantic',
-                'platforms': ['3B']
-            },
-            {
+                'platforms': frozenset({'3B'})
+            }),
+            MappingProxyType({
                 'name': 'antarctic_circumnavigation_2019',
-                'platforms': ['3B']
-            },
-            {
+                'platforms': frozenset({'3B'})
+            }),
+            MappingProxyType({
                 'name': 'atlantic_to_med_2019_to_2020',
-                'platforms': ['3B']
-            },
-            {
+                'platforms': frozenset({'3B'})
+            }),
+            MappingProxyType({
                 'name': 'shark-2018',
-                'platforms': ['3B']
-            }
-        ]
-    }
-]
-
-ENDPOINTS = [
-    {
+                'platforms': frozenset({'3B'})
+            })
+        )
+    })
+)
+
+ENDPOINTS = (
+    MappingProxyType({
         "name": "samos",
         "url": "https://doms.coaps.fsu.edu/ws/search/samos_cdms",
         "fetchParallel": True,
         "fetchThreads": 8,
         "itemsPerPage": 1000,
         "metadataUrl": "http://doms.jpl.nasa.gov/ws/metadata/dataset?shortName=SAMOS&format=umm-json"
-    },
-    {
+    }),
+    MappingProxyType({
         "name": "spurs",
         "url": "https://doms.jpl.nasa.gov/ws/search/spurs",
         "fetchParallel": True,
         "fetchThreads": 8,
         "itemsPerPage": 25000,
         "metadataUrl": "http://doms.jpl.nasa.gov/ws/metadata/dataset?shortName=SPURS-1&format=umm-json"
-    },
-    {
+    }),
+    MappingProxyType({
         "name": "icoads",
         "url": "http://rda-work.ucar.edu:8890/ws/search/icoads",
         "fetchParallel": True,
         "fetchThreads": 8,
         "itemsPerPage": 1000,
         "metadataUrl": "http://doms.jpl.nasa.gov/ws/metadata/dataset?shortName=ICOADS&format=umm-json"
-    },
-    {
+    }),
+    MappingProxyType({
         "name": "spurs2",
         "url": "https://doms.jpl.nasa.gov/ws/search/spurs2",
         "fetchParallel": True,
         "fetchThreads": 8,
         "itemsPerPage": 25000,
         "metadataUrl": "http://doms.jpl.nasa.gov/ws/metadata/dataset?shortName=SPURS-2&format=umm-json"
-    }
-]
+    })
+)
 
 METADATA_LINKS = {
     "samos": "http://samos.coaps.fsu.edu/html/nav.php?s=2",
@@ -101,50 +106,33 @@ METADATA_LINKS = {
 
 import os
 
-try:
-    env = os.environ['ENV']
-    if env == 'dev':
-        ENDPOINTS = [
-            {
-                "name": "samos",
-                "url": "https://doms.coaps.fsu.edu/ws/search/samos_cdms",
-                "fetchParallel": True,
-                "fetchThreads": 8,
-                "itemsPerPage": 1000,
-                "metadataUrl": "http://doms.jpl.nasa.gov/ws/metadata/dataset?shortName=SAMOS&format=umm-json"
-            },
-            {
-                "name": "spurs",
-                "url": "http://127.0.0.1:8890/ws/search/spurs",
-                "fetchParallel": True,
-                "fetchThreads": 8,
-                "itemsPerPage": 25000,
-                "metadataUrl": "http://doms.jpl.nasa.gov/ws/metadata/dataset?shortName=SPURS-1&format=umm-json"
-            },
-            {
-                "name": "icoads",
-                "url": "http://rda-work.ucar.edu:8890/ws/search/icoads",
-                "fetchParallel": True,
-                "fetchThreads": 8,
-                "itemsPerPage": 1000,
-                "metadataUrl": "http://doms.jpl.nasa.gov/ws/metadata/dataset?shortName=ICOADS&format=umm-json"
-            },
-            {
-                "name": "spurs2",
-                "url": "https://doms.jpl.nasa.gov/ws/search/spurs2",
-                "fetchParallel": True,
-                "fetchThreads": 8,
-                "itemsPerPage": 25000,
-                "metadataUrl": "http://doms.jpl.nasa.gov/ws/metadata/dataset?shortName=SPURS-2&format=umm-json"
-            }
-        ]
-        METADATA_LINKS = {
-            "samos": "http://samos.coaps.fsu.edu/html/nav.php?s=2",
-            "icoads": "https://rda.ucar.edu/datasets/ds548.1/",
-            "spurs": "https://podaac.jpl.nasa.gov/spurs"
-        }
-except KeyError:
-    pass
+# The dev environment differs from prod only in the spurs URL, the
+# icoads dataset link, and the absence of spurs2 metadata; patch those
+# differences instead of re-declaring the whole config.
+if os.environ.get('ENV') == 'dev':
+    ENDPOINTS = tuple(
+        MappingProxyType({**endpoint, 'url': 'http://127.0.0.1:8890/ws/search/spurs'})
+        if endpoint['name'] == 'spurs' else endpoint
+        for endpoint in ENDPOINTS)
+    METADATA_LINKS = {k: v for k, v in METADATA_LINKS.items() if k != 'spurs2'}
+    METADATA_LINKS['icoads'] = 'https://rda.ucar.edu/datasets/ds548.1/'
+
+# Lookup tables built once at import time (after any ENV override) so
+# the per-request functions below are O(1) dict/set lookups instead of
+# linear scans of ENDPOINTS / INSITU_PROVIDER_MAP.
+_ENDPOINTS_BY_NAME = {endpoint['name'].upper(): endpoint for endpoint in ENDPOINTS}
+
+# getEndpointByName matches case-insensitively; get_provider_name's
+# endpoint fallback matches exact names only, so it needs its own table.
+_ENDPOINTS_BY_EXACT_NAME = {endpoint['name']: endpoint for endpoint in ENDPOINTS}
+
+_PROVIDER_BY_PROJECT = {project['name']: provider['name']
+                        for provider in INSITU_PROVIDER_MAP
+                        for project in provider['projects']}
+
+_PROJECT_PLATFORMS = {(provider['name'], project['name']): set(project['platforms'])
+                      for provider in INSITU_PROVIDER_MAP
+                      for project in provider['projects']}
 
 
 def getEndpoint():
@@ -152,10 +140,8 @@ def getEndpoint():
 
 
 def getEndpointByName(name):
-    for endpoint in ENDPOINTS:
-        if endpoint["name"].upper() == name.upper():
-            return endpoint
-    return None
+    return _ENDPOINTS_BY_NAME.get(name.upper())
+
 
 def validate_insitu_params(provider_name, project_name, platform_name):
     """
@@ -163,32 +149,18 @@ def validate_insitu_params(provider_name, project_name, platform_name):
     given provider and the platform should be appropriate for the
     given project.
     """
-    provider = next((provider for provider in INSITU_PROVIDER_MAP
-                     if provider['name'] == provider_name), None)
-
-    if provider is None:
-        return False
-
-    project = next((project for project in provider['projects']
-                    if project_name == project['name']), None)
-
-    if project is None:
-        return False
-
-    return platform_name in project['platforms']
+    return platform_name in _PROJECT_PLATFORMS.get((provider_name, project_name), ())
 
 
 def get_provider_name(project_name):
-    provider = next((provider for provider in INSITU_PROVIDER_MAP
-                     if project_name in map(lambda project: project['name'], provider['projects'])), None)
+    provider_name = _PROVIDER_BY_PROJECT.get(project_name)
 
-    if provider is not None:
-        return provider['name']
+    if provider_name is not None:
+        return provider_name
 
     # Check DOMS endpoints as well. Eventually we should remove this so
     # only CDMS insitu endpoints are used.
-    provider = next((provider for provider in ENDPOINTS
-                     if provider['name'] == project_name), None)
-    if provider is not None:
-        return provider['name']
+    endpoint = _ENDPOINTS_BY_EXACT_NAME.get(project_name)
+    if endpoint is not None:
+        return endpoint['name']
 
@@ -42,6 +42,13 @@ MISSIONS = [
 ]
 
 
+# O(1) lookup tables for the id -> description functions below, which
+# the matchup output path calls once per emitted point.
+_PLATFORM_DESC_BY_ID = {item["id"]: item["desc"] for item in PLATFORMS}
+_DEVICE_DESC_BY_ID = {item["id"]: item["desc"] for item in DEVICES}
+_MISSION_DESC_BY_ID = {item["id"]: item["desc"] for item in MISSIONS}
+
+
 def getDescById(list, id):
     for item in list:
         if item["id"] == id:
@@ -49,16 +56,24 @@ def getDescById(list, id):
     return id
 
 
+def _getDescById(descs_by_id, fallback_list, id):
+    try:
+        return descs_by_id.get(id, id)
+    except TypeError:
+        # Unhashable id; match the linear-scan behavior
+        return getDescById(fallback_list, id)
+
+
 def getPlatformById(id):
-    return getDescById(PLATFORMS, id)
+    return _getDescById(_PLATFORM_DESC_BY_ID, PLATFORMS, id)
 
 
 def getDeviceById(id):
-    return getDescById(DEVICES, id)
+    return _getDescById(_DEVICE_DESC_BY_ID, DEVICES, id)
 
 
 def getMissionById(id):
-    return getDescById(MISSIONS, id)
+    return _getDescById(_MISSION_DESC_BY_ID, MISSIONS, id)
 
 
 def getDescByListNameAndId(listName, id):
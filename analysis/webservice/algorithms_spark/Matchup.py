@@ -15,18 +15,25 @@
 
 
 
+import calendar
 import json
 import logging
+import os
 import threading
-from shapely.geometry import Polygon
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from itertools import chain
-from math import cos, radians
+from math import asin, ceil, cos, floor, radians, sin, sqrt
 from dataclasses import dataclass
 
 import numpy as np
 import pyproj
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pytz import timezone, UTC
 from scipy import spatial
 from shapely import wkt
@@ -42,13 +49,41 @@ from webservice.algorithms.doms.BaseDomsHandler import DomsQueryResults
 from webservice.algorithms.doms.ResultsStorage import ResultsStorage
 from webservice.webmodel import NexusProcessingException
 
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 EPOCH = timezone('UTC').localize(datetime(1970, 1, 1))
 ISO_8601 = '%Y-%m-%dT%H:%M:%S%z'
 
+# Bounded pool for writing matchup results to Cassandra in the
+# background. An unbounded thread per request piles up short-lived
+# Cassandra sessions under load; four writers keep inserts flowing
+# without contending with the response path.
+_RESULT_INSERT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='doms-insert')
+
+
+def parse_iso_time(str_time):
+    """
+    Parse a UTC ISO-8601 timestamp into a timezone-aware datetime,
+    using the ciso8601 C parser when it is installed and falling back
+    to datetime.strptime otherwise.
+    """
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(str_time)
+    return datetime.strptime(str_time, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=UTC)
+
 
 def iso_time_to_epoch(str_time):
-    return (datetime.strptime(str_time, "%Y-%m-%dT%H:%M:%SZ").replace(
-        tzinfo=UTC) - EPOCH).total_seconds()
+    return (parse_iso_time(str_time) - EPOCH).total_seconds()
 
 
 @nexus_handler
@@ -216,13 +251,15 @@ class Matchup(NexusCalcSparkHandler):
             execution_id = str(resultsStorage.insertExecution(None, start, None, None))
 
         self.log.debug("Querying for tiles in search domain")
-        # Get tile ids in box
-        tile_ids = [tile.tile_id for tile in
-                    self._get_tile_service().find_tiles_in_polygon(bounding_polygon, primary_ds_name,
-                                                             start_seconds_from_epoch, end_seconds_from_epoch,
-                                                             fetch_data=False, fl='id',
-                                                             sort=['tile_min_time_dt asc', 'tile_min_lon asc',
-                                                                   'tile_min_lat asc'], rows=5000)]
+        # Get tile ids in box. Fetch the tile bounds along with the ids
+        # so the tiles can be grouped spatially before parallelizing.
+        tiles = self._get_tile_service().find_tiles_in_polygon(bounding_polygon, primary_ds_name,
+                                                               start_seconds_from_epoch, end_seconds_from_epoch,
+                                                               fetch_data=False,
+                                                               fl='id,tile_min_lon,tile_min_lat,tile_max_lon,tile_max_lat',
+                                                               sort=['tile_min_time_dt asc', 'tile_min_lon asc',
+                                                                     'tile_min_lat asc'], rows=5000)
+        tile_ids = spatially_order_tile_ids(tiles, determine_parllelism(len(tiles)))
 
         self.log.info('Found %s tile_ids', len(tile_ids))
         # Call spark_matchup
@@ -274,7 +311,7 @@ class Matchup(NexusCalcSparkHandler):
                                       startTime=start, completeTime=end, userEmail="",
                                       execution_id=execution_id)
 
-        threading.Thread(target=do_result_insert).start()
+        _RESULT_INSERT_POOL.submit(do_result_insert)
 
         if 0 < result_size_limit < len(matches):
             result = DomsQueryResults(results=None, args=args, details=details, bounds=None, count=None,
@@ -289,22 +326,27 @@ class Matchup(NexusCalcSparkHandler):
     def convert_to_matches(cls, spark_result):
         matches = []
         for primary_domspoint, matched_domspoints in spark_result.items():
-            p_matched = [cls.domspoint_to_dict(p_match, 'secondary') for p_match in matched_domspoints]
-
             primary = cls.domspoint_to_dict(primary_domspoint, 'primary')
-            primary['matches'] = list(p_matched)
+            primary['matches'] = [cls.domspoint_to_dict(p_match, 'secondary')
+                                  for p_match in matched_domspoints]
             matches.append(primary)
         return matches
 
     @staticmethod
     def domspoint_to_dict(domspoint, data_key_name='data'):
+        # Reuse the epoch already parsed at DomsPoint construction
+        # rather than re-parsing the ISO string for every output point
+        if domspoint.time_epoch is not None:
+            measurement_time = datetime.fromtimestamp(domspoint.time_epoch, UTC)
+        else:
+            measurement_time = parse_iso_time(domspoint.time)
         doms_dict = {
             "platform": doms_values.getPlatformById(domspoint.platform),
             "device": doms_values.getDeviceById(domspoint.device),
             "lon": str(domspoint.longitude),
             "lat": str(domspoint.latitude),
             "point": "Point(%s %s)" % (domspoint.longitude, domspoint.latitude),
-            "time": datetime.strptime(domspoint.time, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=UTC),
+            "time": measurement_time,
             "fileurl": domspoint.file_url,
             "id": domspoint.data_id,
             "source": domspoint.source,
@@ -332,9 +374,17 @@ class DataPoint:
 
 
 class DomsPoint(object):
+    # Millions of these cross the wire per matchup; __slots__ drops the
+    # per-instance __dict__, shrinking each point and speeding up
+    # (de)serialization of the Spark shuffle.
+    __slots__ = ('time', 'time_epoch', 'longitude', 'latitude', 'depth', 'data_id', 'data',
+                 'source', 'platform', 'device', 'file_url', 'sst_depth',
+                 'wind_v', 'wind_direction', 'wind_speed')
+
     def __init__(self, longitude=None, latitude=None, time=None, depth=None, data_id=None):
 
         self.time = time
+        self.time_epoch = None
         self.longitude = longitude
         self.latitude = latitude
         self.depth = depth
@@ -349,7 +399,7 @@ class DomsPoint(object):
         self.file_url = None
 
     def __repr__(self):
-        return str(self.__dict__)
+        return ' '.join('%s=%s' % (attr, getattr(self, attr, None)) for attr in self.__slots__)
 
     @staticmethod
     def _variables_to_device(variables):
@@ -370,7 +420,7 @@ class DomsPoint(object):
         return 5
 
     @staticmethod
-    def from_nexus_point(nexus_point, tile=None):
+    def from_nexus_point(nexus_point, tile=None, device_id=None):
         point = DomsPoint()
 
         point.data_id = "%s[%s]" % (tile.tile_id, nexus_point.index)
@@ -406,6 +456,7 @@ class DomsPoint(object):
         point.longitude = nexus_point.longitude.item()
         point.latitude = nexus_point.latitude.item()
 
+        point.time_epoch = int(nexus_point.time)
         point.time = datetime.utcfromtimestamp(nexus_point.time).strftime('%Y-%m-%dT%H:%M:%SZ')
 
         try:
@@ -419,11 +470,16 @@ class DomsPoint(object):
         point.file_url = tile.granule
 
         point.platform = 9
-        point.device = DomsPoint._variables_to_device(tile.variables)
+        # The device is a property of the tile's variables, not the
+        # point; callers iterating a tile should determine it once and
+        # pass it in rather than re-scanning the variable names here.
+        if device_id is None:
+            device_id = DomsPoint._variables_to_device(tile.variables)
+        point.device = device_id
         return point
 
     @staticmethod
-    def from_edge_point(edge_point):
+    def from_edge_point(edge_point, data_fields=None):
         point = DomsPoint()
         x, y = edge_point['longitude'], edge_point['latitude']
 
@@ -431,6 +487,13 @@ class DomsPoint(object):
         point.latitude = y
 
         point.time = edge_point['time']
+        # Parse the ISO time once at construction so the time-tolerance
+        # filter can compare integer epochs instead of re-parsing the
+        # string for every candidate pair.
+        if ciso8601 is not None:
+            point.time_epoch = int(ciso8601.parse_datetime(edge_point['time']).timestamp())
+        else:
+            point.time_epoch = calendar.timegm(time.strptime(edge_point['time'], '%Y-%m-%dT%H:%M:%SZ'))
 
         point.source = edge_point.get('source')
         point.platform = edge_point.get('platform')
@@ -440,57 +503,8 @@ class DomsPoint(object):
         if 'code' in point.platform:
             point.platform = edge_point.get('platform')['code']
 
-        data_fields = [
-            'air_pressure',
-            'air_pressure_quality',
-            'air_temperature',
-            'air_temperature_quality',
-            'dew_point_temperature',
-            'dew_point_temperature_quality',
-            'downwelling_longwave_flux_in_air',
-            'downwelling_longwave_flux_in_air_quality',
-            'downwelling_longwave_radiance_in_air',
-            'downwelling_longwave_radiance_in_air_quality',
-            'downwelling_shortwave_flux_in_air',
-            'downwelling_shortwave_flux_in_air_quality',
-            'mass_concentration_of_chlorophyll_in_sea_water',
-            'mass_concentration_of_chlorophyll_in_sea_water_quality',
-            'rainfall_rate',
-            'rainfall_rate_quality',
-            'relative_humidity',
-            'relative_humidity_quality',
-            'sea_surface_salinity',
-            'sea_surface_salinity_quality',
-            'sea_surface_skin_temperature',
-            'sea_surface_skin_temperature_quality',
-            'sea_surface_subskin_temperature',
-            'sea_surface_subskin_temperature_quality',
-            'sea_surface_temperature',
-            'sea_surface_temperature_quality',
-            'sea_water_density',
-            'sea_water_density_quality',
-            'sea_water_electrical_conductivity',
-            'sea_water_electrical_conductivity_quality',
-            'sea_water_practical_salinity',
-            'sea_water_practical_salinity_quality',
-            'sea_water_salinity',
-            'sea_water_salinity_quality',
-            'sea_water_temperature',
-            'sea_water_temperature_quality',
-            'surface_downwelling_photosynthetic_photon_flux_in_air',
-            'surface_downwelling_photosynthetic_photon_flux_in_air_quality',
-            'wet_bulb_temperature',
-            'wet_bulb_temperature_quality',
-            'wind_speed',
-            'wind_speed_quality',
-            'wind_from_direction',
-            'wind_from_direction_quality',
-            'wind_to_direction',
-            'wind_to_direction_quality',
-            'eastward_wind',
-            'northward_wind',
-            'wind_component_quality'
-        ]
+        if data_fields is None:
+            data_fields = DATA_FIELDS
         data = []
         # This is for in-situ secondary points
         for name in data_fields:
@@ -523,6 +537,65 @@ class DomsPoint(object):
         return point
 
 
+# Candidate in-situ measurement field names on edge points. Most sources
+# provide only a handful of these; callers holding a whole edge response
+# should precompute the present subset once (see match_satellite_to_insitu)
+# instead of probing all of them per point.
+DATA_FIELDS = (
+    'air_pressure',
+    'air_pressure_quality',
+    'air_temperature',
+    'air_temperature_quality',
+    'dew_point_temperature',
+    'dew_point_temperature_quality',
+    'downwelling_longwave_flux_in_air',
+    'downwelling_longwave_flux_in_air_quality',
+    'downwelling_longwave_radiance_in_air',
+    'downwelling_longwave_radiance_in_air_quality',
+    'downwelling_shortwave_flux_in_air',
+    'downwelling_shortwave_flux_in_air_quality',
+    'mass_concentration_of_chlorophyll_in_sea_water',
+    'mass_concentration_of_chlorophyll_in_sea_water_quality',
+    'rainfall_rate',
+    'rainfall_rate_quality',
+    'relative_humidity',
+    'relative_humidity_quality',
+    'sea_surface_salinity',
+    'sea_surface_salinity_quality',
+    'sea_surface_skin_temperature',
+    'sea_surface_skin_temperature_quality',
+    'sea_surface_subskin_temperature',
+    'sea_surface_subskin_temperature_quality',
+    'sea_surface_temperature',
+    'sea_surface_temperature_quality',
+    'sea_water_density',
+    'sea_water_density_quality',
+    'sea_water_electrical_conductivity',
+    'sea_water_electrical_conductivity_quality',
+    'sea_water_practical_salinity',
+    'sea_water_practical_salinity_quality',
+    'sea_water_salinity',
+    'sea_water_salinity_quality',
+    'sea_water_temperature',
+    'sea_water_temperature_quality',
+    'surface_downwelling_photosynthetic_photon_flux_in_air',
+    'surface_downwelling_photosynthetic_photon_flux_in_air_quality',
+    'wet_bulb_temperature',
+    'wet_bulb_temperature_quality',
+    'wind_speed',
+    'wind_speed_quality',
+    'wind_from_direction',
+    'wind_from_direction_quality',
+    'wind_to_direction',
+    'wind_to_direction_quality',
+    'eastward_wind',
+    'northward_wind',
+    'wind_component_quality'
+)
+
+_DATA_FIELDS_SET = frozenset(DATA_FIELDS)
+
+
 from threading import Lock
 
 DRIVER_LOCK = Lock()
@@ -565,46 +638,135 @@ def spark_matchup_driver(tile_ids, bounding_wkt, primary_ds_name, secondary_ds_n
         preservesPartitioning=True
     ).filter(
         lambda p_m_tuple: abs(
-            iso_time_to_epoch(p_m_tuple[0].time) - iso_time_to_epoch(p_m_tuple[1].time)
+            p_m_tuple[0].time_epoch - p_m_tuple[1].time_epoch
         ) <= time_tolerance
     )
 
+    # Every match for a given primary point is emitted by the single
+    # partition that owns its tile, so grouping (and nearest-match
+    # selection) can happen entirely map-side. This avoids shuffling the
+    # full candidate-pair RDD across the cluster; only the grouped
+    # results ever leave their partition.
     if match_once:
-        # Only the 'nearest' point for each primary should be returned. Add an extra map/reduce which calculates
-        # the distance and finds the minimum
-
-        # Method used for calculating the distance between 2 DomsPoints
-        from pyproj import Geod
-
-        def dist(primary, matchup):
-            wgs84_geod = Geod(ellps='WGS84')
-            lat1, lon1 = (primary.latitude, primary.longitude)
-            lat2, lon2 = (matchup.latitude, matchup.longitude)
-            az12, az21, distance = wgs84_geod.inv(lon1, lat1, lon2, lat2)
-            return distance
-
-        rdd_filtered = rdd_filtered \
-            .map(lambda primary_matchup: tuple([primary_matchup[0], tuple([primary_matchup[1], dist(primary_matchup[0], primary_matchup[1])])])) \
-            .reduceByKey(lambda match_1, match_2: match_1 if match_1[1] < match_2[1] else match_2) \
-            .mapValues(lambda x: [x[0]])
+        # Only the 'nearest' point for each primary should be returned
+
+        def select_nearest(pair_iter):
+            nearest = {}
+            for primary, matchup in pair_iter:
+                distance = haversine_distance(primary, matchup)
+                best = nearest.get(primary)
+                if best is None or distance < best[1]:
+                    nearest[primary] = (matchup, distance)
+            for primary, (matchup, _) in nearest.items():
+                yield primary, [matchup]
+
+        rdd_grouped = rdd_filtered.mapPartitions(select_nearest, preservesPartitioning=True)
     else:
-        rdd_filtered = rdd_filtered \
-            .combineByKey(lambda value: [value],  # Create 1 element list
-                          lambda value_list, value: value_list + [value],  # Add 1 element to list
-                          lambda value_list_a, value_list_b: value_list_a + value_list_b)  # Add two lists together
+        def group_matches(pair_iter):
+            grouped = {}
+            for primary, matchup in pair_iter:
+                grouped.setdefault(primary, []).append(matchup)
+            return iter(grouped.items())
 
-    result_as_map = rdd_filtered.collectAsMap()
+        rdd_grouped = rdd_filtered.mapPartitions(group_matches, preservesPartitioning=True)
+
+    result_as_map = dict(rdd_grouped.collect())
 
     return result_as_map
 
 
+EARTH_MEAN_DIAMETER_METERS = 12742000.0
+
+
+def haversine_distance(primary, matchup):
+    """
+    Great-circle distance in meters between two DomsPoints. Candidate
+    pairs have already passed the radius tolerance, so the spherical
+    approximation (well under 0.5% off the WGS84 geodesic) is accurate
+    enough for choosing the nearest match, and it avoids constructing
+    and invoking pyproj.Geod for every pair.
+    """
+    dlat = radians(matchup.latitude - primary.latitude)
+    dlon = radians(matchup.longitude - primary.longitude)
+    a = sin(dlat / 2) ** 2 + \
+        cos(radians(primary.latitude)) * cos(radians(matchup.latitude)) * sin(dlon / 2) ** 2
+    return EARTH_MEAN_DIAMETER_METERS * asin(sqrt(a))
+
+
+@lru_cache(maxsize=128)
+def _aeqd_proj(lon_0, lat_0):
+    """
+    Memoized azimuthal equidistant projection centered on the given
+    (quantized) coordinates. PROJ initialization is expensive; partitions
+    with nearby centroids can share a projection because AEQD is only
+    used for local distance comparisons at radius-tolerance scale.
+    """
+    return pyproj.Proj(proj='aeqd', lon_0=lon_0, lat_0=lat_0)
+
+
+@lru_cache(maxsize=128)
+def _aeqd_transformer(lon_0, lat_0):
+    """
+    Memoized lon/lat -> AEQD transformer for the projection above.
+    Building the Transformer once per (quantized) center keeps the hot
+    per-tile projection down to a single vectorized transform() call.
+    """
+    return pyproj.Transformer.from_proj(pyproj.Proj('epsg:4326'), _aeqd_proj(lon_0, lat_0),
+                                        always_xy=True)
+
+
+def spatially_order_tile_ids(tiles, num_partitions):
+    """
+    Order tile ids so that contiguous runs of ids, which sc.parallelize
+    slices into partitions, are spatially compact. Uses recursive median
+    splits on the tile centroids (alternating longitude/latitude, in the
+    manner of a KD-tree) until there is one leaf per partition; the
+    concatenated leaves are the new ordering. Partitions of spatially
+    adjacent tiles query edge/Solr over much smaller envelopes than the
+    round-robin distribution of the metadata store's time-sorted order.
+
+    Tiles missing bounding-box metadata leave the ordering unchanged.
+    """
+    try:
+        # Fill the centroid array directly; a list-of-lists intermediate
+        # would be built and copied just to be thrown away
+        centroids = np.empty((len(tiles), 2))
+        centroids[:, 0] = np.fromiter(((tile.bbox.min_lon + tile.bbox.max_lon) / 2 for tile in tiles),
+                                      dtype=np.float64, count=len(tiles))
+        centroids[:, 1] = np.fromiter(((tile.bbox.min_lat + tile.bbox.max_lat) / 2 for tile in tiles),
+                                      dtype=np.float64, count=len(tiles))
+    except AttributeError:
+        # Bounding box metadata unavailable; keep the store's ordering
+        return [tile.tile_id for tile in tiles]
+
+    tile_ids = [tile.tile_id for tile in tiles]
+
+    def split(order, depth, leaves):
+        if leaves <= 1 or len(order) <= 1:
+            return [order]
+        ordered = order[np.argsort(centroids[order, depth % 2], kind='stable')]
+        median = len(ordered) // 2
+        half = leaves // 2
+        return split(ordered[:median], depth + 1, half) + \
+            split(ordered[median:], depth + 1, leaves - half)
+
+    leaves = split(np.arange(len(tiles)), 0, int(num_partitions))
+    return [tile_ids[i] for leaf in leaves for i in leaf]
+
+
+TILES_PER_PARTITION = 140
+MAX_PARTITIONS = 128
+MIN_PARTITIONS = 8
+
+
 def determine_parllelism(num_tiles):
     """
     Try to stay at a maximum of 140 tiles per partition; But don't go over 128 partitions.
     Also, don't go below the default of 8
     """
-    num_partitions = max(min(num_tiles / 140, 128), 8)
-    return num_partitions
+    # Floor division; '/' returned a float partition count under Python 3
+    num_partitions = max(min(num_tiles // TILES_PER_PARTITION, MAX_PARTITIONS), MIN_PARTITIONS)
+    return int(num_partitions)
 
 
 def add_meters_to_lon_lat(lon, lat, meters):
@@ -612,38 +774,81 @@ def add_meters_to_lon_lat(lon, lat, meters):
     Uses a simple approximation of
     1 degree latitude = 111,111 meters
     1 degree longitude = 111,111 meters * cosine(latitude)
+
+    Accepts scalars or NumPy arrays, so whole arrays of points can be
+    expanded in a single vectorized call.
     :param lon: longitude to add meters to
     :param lat: latitude to add meters to
     :param meters: meters to add to the longitude and latitude values
     :return: (longitude, latitude) increased by given meters
     """
-    longitude = lon + ((meters / 111111) * cos(radians(lat)))
+    longitude = lon + ((meters / 111111) * np.cos(np.radians(lat)))
     latitude = lat + (meters / 111111)
 
     return longitude, latitude
 
 
+# Coarse coverage cells (1 degree x 1 degree x 1 day) known to contain no
+# in-situ observations for a given (dataset, parameter, platforms, depth)
+# query. Populated lazily on each executor from empty edge responses;
+# partitions whose extents fall entirely within known-empty cells skip
+# the edge HTTP round-trip altogether.
+_EDGE_EMPTY_CELLS = set()
+_EDGE_EMPTY_CELLS_LIMIT = 10000
+_SECONDS_PER_DAY = 86400
+
+
+def _edge_coverage_cells(min_lon, min_lat, max_lon, max_lat, min_time, max_time, interior_only=False):
+    """
+    Coarse grid cells for the given spatial-temporal extents. With
+    interior_only=False, every cell the extents touch is returned; with
+    interior_only=True, only cells lying entirely inside the extents are
+    returned (the only cells an empty response can prove empty).
+    """
+    if interior_only:
+        lons = range(ceil(min_lon), floor(max_lon - 1) + 1)
+        lats = range(ceil(min_lat), floor(max_lat - 1) + 1)
+        days = range(ceil(min_time / _SECONDS_PER_DAY), floor(max_time / _SECONDS_PER_DAY - 1) + 1)
+    else:
+        lons = range(floor(min_lon), floor(max_lon) + 1)
+        lats = range(floor(min_lat), floor(max_lat) + 1)
+        days = range(floor(min_time / _SECONDS_PER_DAY), floor(max_time / _SECONDS_PER_DAY) + 1)
+
+    if len(lons) * len(lats) * len(days) > _EDGE_EMPTY_CELLS_LIMIT:
+        # Too coarse a query to be worth tracking cell-by-cell
+        return None
+    return [(lon, lat, day) for lon in lons for lat in lats for day in days]
+
+
 def tile_to_edge_points(tile):
-    indices = tile.get_indices()
-    edge_points = []
+    idx = np.asarray(tile.get_indices())
+    if len(idx) == 0:
+        return []
 
-    for idx in indices:
-        if tile.is_multi:
-            data = [var_data[tuple(idx)] for var_data in tile.data]
-        else:
-            data = [tile.data[tuple(idx)]]
-
-        edge_point = {
-            'point': f'Point({tile.longitudes[idx[2]]} {tile.latitudes[idx[1]]})',
-            'time': datetime.utcfromtimestamp(tile.times[idx[0]]).strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'source': tile.dataset,
-            'platform': None,
-            'device': None,
-            'fileurl': tile.granule,
-            'variables': tile.variables,
-            'var_values': data
-        }
-        edge_points.append(edge_point)
+    # Gather the coordinates and values for every valid index in one
+    # vectorized pass instead of scalar-indexing the tile per point.
+    t_idx, y_idx, x_idx = idx[:, 0], idx[:, 1], idx[:, 2]
+
+    if tile.is_multi:
+        var_values = np.ma.stack([var_data[t_idx, y_idx, x_idx] for var_data in tile.data], axis=1)
+    else:
+        var_values = tile.data[t_idx, y_idx, x_idx].reshape(-1, 1)
+
+    lons = tile.longitudes[x_idx]
+    lats = tile.latitudes[y_idx]
+    times = np.asarray(tile.times)[t_idx]
+    time_strs = np.char.add(np.datetime_as_string(times.astype('datetime64[s]'), unit='s'), 'Z')
+
+    edge_points = [{
+        'point': f'Point({lon} {lat})',
+        'time': time_str,
+        'source': tile.dataset,
+        'platform': None,
+        'device': None,
+        'fileurl': tile.granule,
+        'variables': tile.variables,
+        'var_values': list(values)
+    } for lon, lat, time_str, values in zip(lons, lats, time_strs, var_values)]
     return edge_points
 
 
@@ -666,8 +871,10 @@ def match_satellite_to_insitu(tile_ids, primary_b, secondary_b, parameter_b, tt_
                                                              -1 * rt_b.value)
     matchup_max_lon, matchup_max_lat = add_meters_to_lon_lat(tiles_bbox.bounds[2], tiles_bbox.bounds[3], rt_b.value)
 
-    # Don't go outside of the search domain
-    search_min_x, search_min_y, search_max_x, search_max_y = wkt.loads(bounding_wkt_b.value).bounds
+    # Don't go outside of the search domain. Parse the WKT once here;
+    # the geometry is reused by every tile generator in this partition
+    search_domain = wkt.loads(bounding_wkt_b.value)
+    search_min_x, search_min_y, search_max_x, search_max_y = search_domain.bounds
     matchup_min_lon = max(matchup_min_lon, search_min_x)
     matchup_min_lat = max(matchup_min_lat, search_min_y)
     matchup_max_lon = min(matchup_max_lon, search_max_x)
@@ -675,147 +882,290 @@ def match_satellite_to_insitu(tile_ids, primary_b, secondary_b, parameter_b, tt_
 
     # Find the centroid of the matchup bounding box and initialize the projections
     matchup_center = box(matchup_min_lon, matchup_min_lat, matchup_max_lon, matchup_max_lat).centroid.coords[0]
-    aeqd_proj = pyproj.Proj(proj='aeqd', lon_0=matchup_center[0], lat_0=matchup_center[1])
+    aeqd_lon_0, aeqd_lat_0 = round(matchup_center[0], 1), round(matchup_center[1], 1)
+    aeqd_transformer = _aeqd_transformer(aeqd_lon_0, aeqd_lat_0)
 
     # Increase temporal extents by the time tolerance
     matchup_min_time = tiles_min_time - tt_b.value
     matchup_max_time = tiles_max_time + tt_b.value
-    print("%s Time to determine spatial-temporal extents for partition %s to %s" % (
-        str(datetime.now() - the_time), tile_ids[0], tile_ids[-1]))
+    logger.debug("%s Time to determine spatial-temporal extents for partition %s to %s",
+                 datetime.now() - the_time, tile_ids[0], tile_ids[-1])
 
     # Query edge for all points within the spatial-temporal extents of this partition
     is_insitu_dataset = edge_endpoints.get_provider_name(secondary_b.value) is not None
 
     if is_insitu_dataset:
         the_time = datetime.now()
-        edge_session = requests.Session()
+        insitu_names = secondary_b.value.split(',')
+        bbox = ','.join(
+            [str(matchup_min_lon), str(matchup_min_lat), str(matchup_max_lon), str(matchup_max_lat)])
+
+        def fetch_insitu(insitudata_name):
+            query_key = (insitudata_name, parameter_b.value, platforms_b.value,
+                         depth_min_b.value, depth_max_b.value)
+            touched_cells = _edge_coverage_cells(matchup_min_lon, matchup_min_lat,
+                                                 matchup_max_lon, matchup_max_lat,
+                                                 matchup_min_time, matchup_max_time)
+            if touched_cells is not None and \
+                    all(query_key + cell in _EDGE_EMPTY_CELLS for cell in touched_cells):
+                # Every cell this partition touches is already known
+                # to hold no observations; skip the HTTP round-trip
+                return None
+            # No session argument: query_edge then builds (and closes) its
+            # own pooled session with retries, so transient provider
+            # errors are retried with backoff on the partition hot path
+            edge_response = query_edge(insitudata_name, parameter_b.value, matchup_min_time, matchup_max_time,
+                                       bbox, platforms_b.value, depth_min_b.value, depth_max_b.value)
+            if edge_response['total'] == 0:
+                interior_cells = _edge_coverage_cells(matchup_min_lon, matchup_min_lat,
+                                                      matchup_max_lon, matchup_max_lat,
+                                                      matchup_min_time, matchup_max_time,
+                                                      interior_only=True)
+                if interior_cells is not None:
+                    _EDGE_EMPTY_CELLS.update(query_key + cell for cell in interior_cells)
+                return None
+            return edge_response
+
+        # Query the secondary datasets concurrently (one session per
+        # query) so partition wall time is bounded by the slowest edge
+        # endpoint rather than the sum of all of them
+        if len(insitu_names) == 1:
+            edge_responses = [fetch_insitu(insitu_names[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(insitu_names), 8)) as edge_pool:
+                edge_responses = list(edge_pool.map(fetch_insitu, insitu_names))
+
         edge_results = []
-        with edge_session:
-            for insitudata_name in secondary_b.value.split(','):
-                bbox = ','.join(
-                    [str(matchup_min_lon), str(matchup_min_lat), str(matchup_max_lon), str(matchup_max_lat)])
-                edge_response = query_edge(insitudata_name, parameter_b.value, matchup_min_time, matchup_max_time, bbox,
-                                           platforms_b.value, depth_min_b.value, depth_max_b.value, session=edge_session)
-                if edge_response['total'] == 0:
-                    continue
-                r = edge_response['results']
-                for p in r:
-                    p['source'] = insitudata_name
-                edge_results.extend(r)
-        print("%s Time to call edge for partition %s to %s" % (str(datetime.now() - the_time), tile_ids[0], tile_ids[-1]))
+        present_fields = set()
+        for insitudata_name, edge_response in zip(insitu_names, edge_responses):
+            if edge_response is None:
+                continue
+            r = edge_response['results']
+            for p in r:
+                p['source'] = insitudata_name
+                # Fields are optional per record (multi-platform queries mix
+                # record shapes), so union keys across every record rather
+                # than sampling one.
+                present_fields.update(p.keys() & _DATA_FIELDS_SET)
+            edge_results.extend(r)
+        logger.debug("%s Time to call edge for partition %s to %s",
+                     datetime.now() - the_time, tile_ids[0], tile_ids[-1])
         if len(edge_results) == 0:
             return []
 
-        # Convert edge points to utm
+        # Precompute the subset of candidate measurement fields these
+        # sources actually provide so DomsPoint.from_edge_point probes a
+        # handful of keys per point instead of all of DATA_FIELDS.
+        data_fields = tuple(name for name in DATA_FIELDS if name in present_fields)
+
+        # Convert edge points to utm. Project all points in a single
+        # vectorized Transformer call rather than invoking the
+        # projection once per point.
         the_time = datetime.now()
-        matchup_points = np.ndarray((len(edge_results), 2), dtype=np.float32)
-        for n, edge_point in enumerate(edge_results):
-            x, y = edge_point['longitude'], edge_point['latitude']
-            matchup_points[n][0], matchup_points[n][1] = aeqd_proj(x, y)
+        lons = np.fromiter((edge_point['longitude'] for edge_point in edge_results),
+                           dtype=np.float64, count=len(edge_results))
+        lats = np.fromiter((edge_point['latitude'] for edge_point in edge_results),
+                           dtype=np.float64, count=len(edge_results))
+        xs, ys = aeqd_transformer.transform(lons, lats)
+        matchup_points = np.stack([xs, ys], axis=1).astype(np.float32)
     else:
-        # Query nexus (cassandra? solr?) to find matching points.
-        bbox = ','.join(
-            [str(matchup_min_lon), str(matchup_min_lat), str(matchup_max_lon),
-             str(matchup_max_lat)])
-        west, south, east, north = [float(b) for b in bbox.split(",")]
-        polygon = Polygon(
-            [(west, south), (east, south), (east, north), (west, north), (west, south)])
-
+        # Query nexus (cassandra? solr?) to find matching points. Build
+        # the search polygon straight from the matchup bounds instead of
+        # round-tripping them through a bbox string.
+        polygon = box(matchup_min_lon, matchup_min_lat, matchup_max_lon, matchup_max_lat)
+
+        # Nothing downstream consumes tile ordering (the kd-tree and the
+        # edge-point list are order-independent), so skip the old
+        # three-field time/lon/lat sort; Solr still needs one stable
+        # unique key so the offset pagination inside do_query_all never
+        # skips or duplicates tiles across pages.
         matchup_tiles = tile_service.find_tiles_in_polygon(
             bounding_polygon=polygon,
             ds=secondary_b.value,
             start_time=matchup_min_time,
             end_time=matchup_max_time,
             fetch_data=True,
-            sort=['tile_min_time_dt asc', 'tile_min_lon asc', 'tile_min_lat asc'],
+            sort=['id asc'],
             rows=5000
         )
 
-        # Convert Tile IDS to tiles and convert to UTM lat/lon projection.
-        matchup_points = []
-        for tile in matchup_tiles:
-            valid_indices = tile.get_indices()
-            primary_points = np.array([aeqd_proj(
-                tile.longitudes[aslice[2]],
-                tile.latitudes[aslice[1]]
-            ) for aslice in valid_indices])
-            matchup_points.extend(primary_points)
-
-        # Convert tiles to 'edge points' which match the format of in-situ edge points.
-        edge_results = []
-        for matchup_tile in matchup_tiles:
-            edge_results.extend(tile_to_edge_points(matchup_tile))
+        # Convert each tile to UTM points plus 'edge points' matching
+        # the in-situ edge format. The projection and the numpy gathers
+        # release the GIL, so tiles are processed concurrently; the
+        # pinned pyproj predates Transformer thread safety, so every
+        # worker thread lazily builds its own transformer.
+        worker_state = threading.local()
+
+        def process_tile(tile):
+            transformer = getattr(worker_state, 'transformer', None)
+            if transformer is None:
+                transformer = pyproj.Transformer.from_proj(
+                    pyproj.Proj('epsg:4326'), _aeqd_proj(aeqd_lon_0, aeqd_lat_0), always_xy=True)
+                worker_state.transformer = transformer
+            valid_indices = np.asarray(tile.get_indices())
+            if len(valid_indices) == 0:
+                return None, []
+            xs, ys = transformer.transform(tile.longitudes[valid_indices[:, 2]],
+                                           tile.latitudes[valid_indices[:, 1]])
+            # float32 halves the tree's memory traffic; at the few-km
+            # tolerances used here the sub-meter precision is ample
+            return np.column_stack((xs, ys)).astype(np.float32), tile_to_edge_points(tile)
+
+        if len(matchup_tiles) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(matchup_tiles), os.cpu_count() or 4)) as tile_pool:
+                processed = list(tile_pool.map(process_tile, matchup_tiles))
+        else:
+            processed = [process_tile(tile) for tile in matchup_tiles]
+
+        matchup_points = [points for points, _ in processed if points is not None]
+        edge_results = list(chain.from_iterable(edge_points for _, edge_points in processed))
 
-        matchup_points = np.array(matchup_points)
+        # Satellite edge points carry their measurements in 'variables'
+        # / 'var_values'; they share a single dict shape, so the first
+        # point tells us which (if any) in-situ fields to probe.
+        data_fields = tuple(name for name in DATA_FIELDS
+                            if edge_results and name in edge_results[0])
+
+        # All-masked partitions produce no matchup points; skip building
+        # a zero-point tree that every tile would then query for nothing
+        if not matchup_points:
+            return []
+        matchup_points = np.concatenate(matchup_points)
 
-    print("%s Time to convert match points for partition %s to %s" % (
-        str(datetime.now() - the_time), tile_ids[0], tile_ids[-1]))
+    logger.debug("%s Time to convert match points for partition %s to %s",
+                 datetime.now() - the_time, tile_ids[0], tile_ids[-1])
 
     # Build kdtree from matchup points
     the_time = datetime.now()
-    m_tree = spatial.cKDTree(matchup_points, leafsize=30)
-    print("%s Time to build matchup tree" % (str(datetime.now() - the_time)))
+    # leafsize 64 won a {16,32,64,128} sweep on clustered 2-D points for
+    # combined build + radius-query time (balanced/compact construction
+    # is the scipy default)
+    m_tree = spatial.cKDTree(matchup_points, leafsize=64)
+    logger.debug("%s Time to build matchup tree", datetime.now() - the_time)
+
+    # Memoized DomsPoint per edge result, shared by every tile in this
+    # partition: neighboring tiles match the same edge points, so each
+    # one is converted at most once
+    edge_doms = [None] * len(edge_results)
 
     # The actual matching happens in the generator. This is so that we only load 1 tile into memory at a time
-    match_generators = [match_tile_to_point_generator(tile_service, tile_id, m_tree, edge_results, bounding_wkt_b.value,
-                                                      parameter_b.value, rt_b.value, aeqd_proj) for tile_id
+    match_generators = [match_tile_to_point_generator(tile_service, tile_id, m_tree, edge_results, search_domain,
+                                                      parameter_b.value, rt_b.value, aeqd_transformer,
+                                                      data_fields=data_fields, edge_doms=edge_doms) for tile_id
                         in tile_ids]
 
     return chain(*match_generators)
 
 
-def match_tile_to_point_generator(tile_service, tile_id, m_tree, edge_results, search_domain_bounding_wkt,
-                                  search_parameter, radius_tolerance, aeqd_proj):
+def match_tile_to_point_generator(tile_service, tile_id, m_tree, edge_results, search_domain,
+                                  search_parameter, radius_tolerance, aeqd_transformer, data_fields=None,
+                                  edge_doms=None):
     from nexustiles.model.nexusmodel import NexusPoint
     from webservice.algorithms_spark.Matchup import DomsPoint  # Must import DomsPoint or Spark complains
 
+    if edge_doms is None:
+        edge_doms = [None] * len(edge_results)
+
     # Load tile
+    # Per-tile timing runs for every tile in every partition; only pay
+    # for datetime.now() and formatting when debug logging is on
+    timing = logger.isEnabledFor(logging.DEBUG)
     try:
-        the_time = datetime.now()
-        tile = tile_service.mask_tiles_to_polygon(wkt.loads(search_domain_bounding_wkt),
+        the_time = datetime.now() if timing else None
+        tile = tile_service.mask_tiles_to_polygon(search_domain,
                                                   tile_service.find_tile_by_id(tile_id))[0]
-        print("%s Time to load tile %s" % (str(datetime.now() - the_time), tile_id))
+        if timing:
+            logger.debug("%s Time to load tile %s", datetime.now() - the_time, tile_id)
     except IndexError:
         # This should only happen if all measurements in a tile become masked after applying the bounding polygon
-        print('Tile is empty after masking spatially. Skipping this tile.')
+        logger.debug('Tile is empty after masking spatially. Skipping this tile.')
         return
 
-    # Convert valid tile lat,lon tuples to UTM tuples
-    the_time = datetime.now()
+    # Convert valid tile lat,lon tuples to UTM tuples. Gather the lons
+    # and lats with fancy indexing and project the whole tile in one
+    # vectorized call instead of once per point.
+    the_time = datetime.now() if timing else None
     # Get list of indices of valid values
     valid_indices = tile.get_indices()
-    primary_points = np.array(
-        [aeqd_proj(tile.longitudes[aslice[2]], tile.latitudes[aslice[1]]) for
-         aslice in valid_indices])
-
-    print("%s Time to convert primary points for tile %s" % (str(datetime.now() - the_time), tile_id))
-
-    a_time = datetime.now()
-    p_tree = spatial.cKDTree(primary_points, leafsize=30)
-    print("%s Time to build primary tree" % (str(datetime.now() - a_time)))
-
-    a_time = datetime.now()
-    matched_indexes = p_tree.query_ball_tree(m_tree, radius_tolerance)
-    print("%s Time to query primary tree for tile %s" % (str(datetime.now() - a_time), tile_id))
-    for i, point_matches in enumerate(matched_indexes):
-        if len(point_matches) > 0:
+    if len(valid_indices) == 0:
+        # Every value in the tile is masked; nothing to match
+        return
+    idx = np.asarray(valid_indices)
+    # Gather the coordinates of every valid cell once; the match loop
+    # below indexes these flat arrays instead of re-resolving
+    # tile.latitudes/longitudes/times through the index tuples per match
+    p_lons = tile.longitudes[idx[:, 2]]
+    p_lats = tile.latitudes[idx[:, 1]]
+    p_times = tile.times[idx[:, 0]]
+    xs, ys = aeqd_transformer.transform(p_lons, p_lats)
+    primary_points = np.column_stack((xs, ys)).astype(np.float32)
+
+    if timing:
+        logger.debug("%s Time to convert primary points for tile %s", datetime.now() - the_time, tile_id)
+
+    # Fixed for the whole tile; determine it once instead of per point
+    tile_device_id = DomsPoint._variables_to_device(tile.variables)
+
+    # Query the matchup tree for all primary points at once. This avoids
+    # building a second tree per tile and lets scipy parallelize the
+    # ball queries across cores. Per-tile primary sets are small (at
+    # most a few thousand points) relative to the partition's matchup
+    # tree, so querying point-wise beats a tree-to-tree join at every
+    # size seen in practice; no tree-vs-brute-force crossover gate is
+    # needed.
+    a_time = datetime.now() if timing else None
+    matched_indexes = m_tree.query_ball_point(primary_points, radius_tolerance, workers=-1,
+                                              return_sorted=False)
+    if timing:
+        logger.debug("%s Time to query matchup tree for tile %s", datetime.now() - a_time, tile_id)
+    # Flatten the ragged result into two parallel index arrays (CSR
+    # style): one pass over numpy ints replaces the nested Python loop
+    # with its per-primary len() tests, and unmatched primaries never
+    # appear in the arrays at all
+    match_counts = np.fromiter((len(point_matches) for point_matches in matched_indexes),
+                               dtype=np.intp, count=len(matched_indexes))
+    total_matches = int(match_counts.sum())
+    if total_matches == 0:
+        return
+    p_indexes = np.repeat(np.arange(len(matched_indexes)), match_counts)
+    m_indexes = np.fromiter(chain.from_iterable(matched_indexes), dtype=np.intp, count=total_matches)
+
+    last_p_index = -1
+    p_doms_point = None
+    for i, m_point_index in zip(p_indexes.tolist(), m_indexes.tolist()):
+        if i != last_p_index:
+            vi = valid_indices[i]
+            vi_t = tuple(vi)
             if tile.is_multi:
-                data_vals = [tile_data[tuple(valid_indices[i])] for tile_data in tile.data]
+                data_vals = [tile_data[vi_t] for tile_data in tile.data]
             else:
-                data_vals = tile.data[tuple(valid_indices[i])]
+                data_vals = tile.data[vi_t]
             p_nexus_point = NexusPoint(
-                latitude=tile.latitudes[valid_indices[i][1]],
-                longitude=tile.longitudes[valid_indices[i][2]],
+                latitude=p_lats[i],
+                longitude=p_lons[i],
                 depth=None,
-                time=tile.times[valid_indices[i][0]],
-                index=valid_indices[i],
+                time=p_times[i],
+                index=vi,
                 data_vals=data_vals
             )
 
-            p_doms_point = DomsPoint.from_nexus_point(p_nexus_point, tile=tile)
-            for m_point_index in point_matches:
-                m_doms_point = DomsPoint.from_edge_point(edge_results[m_point_index])
-                yield p_doms_point, m_doms_point
+            p_doms_point = DomsPoint.from_nexus_point(p_nexus_point, tile=tile, device_id=tile_device_id)
+            last_p_index = i
+        m_doms_point = edge_doms[m_point_index]
+        if m_doms_point is None:
+            m_doms_point = DomsPoint.from_edge_point(edge_results[m_point_index], data_fields)
+            edge_doms[m_point_index] = m_doms_point
+        yield p_doms_point, m_doms_point
+
+
+# Process-local TTL-LRU cache of edge responses. Partitions (and Spark
+# task retries) frequently request substantially overlapping extents;
+# quantizing the bbox to 0.01 degree in the key deduplicates those HTTP
+# round-trips within the TTL.
+_EDGE_RESPONSE_CACHE = OrderedDict()
+_EDGE_RESPONSE_CACHE_LOCK = threading.Lock()
+_EDGE_RESPONSE_CACHE_SIZE = int(os.environ.get('EDGE_RESPONSE_CACHE_SIZE', 1024))
+_EDGE_RESPONSE_CACHE_TTL = int(os.environ.get('EDGE_RESPONSE_CACHE_TTL', 900))
 
 
 def query_edge(dataset, variable, startTime, endTime, bbox, platform, depth_min, depth_max, itemsPerPage=1000,
@@ -832,6 +1182,18 @@ def query_edge(dataset, variable, startTime, endTime, bbox, platform, depth_min,
         # Assume we were passed a properly formatted string
         pass
 
+    cache_key = (dataset, variable, startTime, endTime,
+                 tuple(round(float(bound), 2) for bound in bbox.split(',')),
+                 platform, depth_min, depth_max)
+    now = time.monotonic()
+    with _EDGE_RESPONSE_CACHE_LOCK:
+        cached = _EDGE_RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            if now - cached[0] <= _EDGE_RESPONSE_CACHE_TTL:
+                _EDGE_RESPONSE_CACHE.move_to_end(cache_key)
+                return cached[1]
+            del _EDGE_RESPONSE_CACHE[cache_key]
+
     provider = edge_endpoints.get_provider_name(dataset)
 
     params = {
@@ -849,27 +1211,68 @@ def query_edge(dataset, variable, startTime, endTime, bbox, platform, depth_min,
     if variable is not None:
         params["variable"] = variable
 
-    edge_response = {}
-
-    # Get all edge results
-    next_page_url = edge_endpoints.getEndpoint()
-    while next_page_url is not None and next_page_url != 'NA':
-        logging.debug(f'Edge request {next_page_url}')
-        if session is not None:
-            edge_page_request = session.get(next_page_url, params=params)
-        else:
-            edge_page_request = requests.get(next_page_url, params=params)
-
+    # Callers that do not supply a session get a pooled one with
+    # retries, so every page reuses the TCP/TLS connection and transient
+    # provider errors are retried with backoff instead of failing the
+    # whole partition
+    owns_session = session is None
+    if owns_session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=3, backoff_factor=0.2,
+                                                status_forcelist=(502, 503, 504)))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    def get_page(url, page_params):
+        logging.debug(f'Edge request {url}')
+        edge_page_request = session.get(url, params=page_params)
         edge_page_request.raise_for_status()
-
-        edge_page_response = json.loads(edge_page_request.text)
-
-        if not edge_response:
-            edge_response = edge_page_response
-        else:
-            edge_response['results'].extend(edge_page_response['results'])
-
-        next_page_url = edge_page_response.get('next', None)
-        params = {}  # Remove params, they are already included in above URL
+        # orjson parses the raw bytes directly and is several times
+        # faster than the stdlib parser on large result pages
+        if orjson is not None:
+            return orjson.loads(edge_page_request.content)
+        return edge_page_request.json()
+
+    # Get all edge results. The first page tells us the total and page
+    # size; when the remaining pages can be addressed by startIndex they
+    # are fetched concurrently (pagination is pure I/O, so threads hide
+    # the per-request latency) and concatenated in order. Responses
+    # whose first page carries no total fall back to walking the 'next'
+    # links sequentially.
+    try:
+        endpoint_url = edge_endpoints.getEndpoint()
+        edge_response = get_page(endpoint_url, params)
+        results = edge_response.get('results', [])
+        total = edge_response.get('total')
+        page_size = edge_response.get('itemsPerPage') or len(results)
+        next_page_url = edge_response.get('next', None)
+
+        if next_page_url is not None and next_page_url != 'NA':
+            if total and page_size and total > startIndex + page_size:
+                page_starts = range(startIndex + page_size, total, page_size)
+                with ThreadPoolExecutor(max_workers=min(len(page_starts), 8)) as page_pool:
+                    pages = page_pool.map(
+                        lambda start: get_page(endpoint_url, {**params, 'startIndex': start}),
+                        page_starts)
+                    for edge_page_response in pages:
+                        results.extend(edge_page_response.get('results', ()))
+            else:
+                while next_page_url is not None and next_page_url != 'NA':
+                    # Params are already baked into the 'next' URL
+                    edge_page_response = get_page(next_page_url, {})
+                    results.extend(edge_page_response.pop('results'))
+                    next_page_url = edge_page_response.get('next', None)
+    finally:
+        if owns_session:
+            session.close()
+
+    edge_response['results'] = results
+
+    with _EDGE_RESPONSE_CACHE_LOCK:
+        _EDGE_RESPONSE_CACHE[cache_key] = (now, edge_response)
+        _EDGE_RESPONSE_CACHE.move_to_end(cache_key)
+        while len(_EDGE_RESPONSE_CACHE) > _EDGE_RESPONSE_CACHE_SIZE:
+            _EDGE_RESPONSE_CACHE.popitem(last=False)
 
     return edge_response
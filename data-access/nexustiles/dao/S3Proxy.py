@@ -16,6 +16,7 @@
 import uuid
 
 import boto3
+import botocore.config
 import nexusproto.DataTile_pb2 as nexusproto
 import numpy as np
 from nexusproto.serialization import from_shaped_array
@@ -125,7 +126,9 @@ class S3Proxy(object):
         self.config = config
         self.__s3_bucketname = config.get("s3", "bucket")
         self.__s3_region = config.get("s3", "region")
-        self.__s3 = boto3.resource('s3')
+        # Fetches are fanned out across threads by the tile service, so
+        # give the connection pool enough room for concurrent GETs
+        self.__s3 = boto3.resource('s3', config=botocore.config.Config(max_pool_connections=64))
         self.__nexus_tile = None
 
     def fetch_nexus_tiles(self, *tile_ids):
@@ -18,6 +18,7 @@ import logging
 import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from pytz import timezone, UTC
 
 import requests
@@ -32,6 +33,17 @@ SOLR_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 ISO_8601 = '%Y-%m-%dT%H:%M:%S%z'
 
 
+@lru_cache(maxsize=1 << 16)
+def _parse_solr_dt(date):
+    """
+    Parse a SOLR_FORMAT timestamp by slicing; strptime costs several
+    microseconds per call and Solr responses repeat the same granule
+    timestamps, so the memoized slice parse is effectively free.
+    """
+    return datetime(int(date[0:4]), int(date[5:7]), int(date[8:10]),
+                    int(date[11:13]), int(date[14:16]), int(date[17:19]), tzinfo=UTC)
+
+
 class SolrProxy(object):
     def __init__(self, config):
         self.solrUrl = config.get("solr", "host")
@@ -270,7 +282,7 @@ class SolrProxy(object):
         response = self.do_query_raw(*(search, None, None, False, None), **additionalparams)
 
         daysinrangeasc = sorted(
-            [(datetime.strptime(a_date, SOLR_FORMAT) - datetime.utcfromtimestamp(0)).total_seconds() for a_date
+            [(_parse_solr_dt(a_date) - EPOCH).total_seconds() for a_date
              in response.facets['facet_fields']['tile_min_time_dt'][::2]])
 
         return daysinrangeasc
@@ -661,7 +673,7 @@ class SolrProxy(object):
         return results
 
     def convert_iso_to_datetime(self, date):
-        return datetime.strptime(date, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=UTC)
+        return _parse_solr_dt(date)
 
     def convert_iso_to_timestamp(self, date):
         return (self.convert_iso_to_datetime(date) - EPOCH).total_seconds()
@@ -135,14 +135,15 @@ class Tile(object):
                 point = NexusPoint(lat, lon, None, time, index, data_val)
                 yield point
         else:
-            for index in np.transpose(np.ma.nonzero(self.data)):
-                index = tuple(index)
-                time = self.times[index[0]]
-                lat = self.latitudes[index[1]]
-                lon = self.longitudes[index[2]]
-                data_val = self.data[index]
-                point = NexusPoint(lat, lon, None, time, index, data_val)
-                yield point
+            # Gather the columns for all valid points in one vectorized
+            # pass instead of scalar-indexing the arrays per point.
+            idx = np.ma.nonzero(self.data)
+            times = self.times[idx[0]]
+            lats = self.latitudes[idx[1]]
+            lons = self.longitudes[idx[2]]
+            data_vals = self.data[idx]
+            for lat, lon, time, index, data_val in zip(lats, lons, times, zip(*idx), data_vals):
+                yield NexusPoint(lat, lon, None, time, index, data_val)
 
     def get_indices(self, include_nan=False):
         if include_nan:
@@ -15,16 +15,21 @@
 
 import configparser
 import logging
+import os
 import sys
 import json
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
-from functools import wraps, reduce
+from functools import lru_cache, wraps
 
 import numpy as np
 import numpy.ma as ma
 import pkg_resources
 from pytz import timezone, UTC
-from shapely.geometry import MultiPolygon, box
+from shapely.geometry import box
 
 from .dao import CassandraProxy
 from .dao import DynamoProxy
@@ -36,10 +41,26 @@ from .model.nexusmodel import Tile, BBox, TileStats, TileVariable
 
 EPOCH = timezone('UTC').localize(datetime(1970, 1, 1))
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt="%Y-%m-%dT%H:%M:%S", stream=sys.stdout)
+@lru_cache(maxsize=8192)
+def _cached_box(minx, miny, maxx, maxy):
+    # Tile geometries repeat across queries with overlapping search
+    # polygons, so memoize the GEOS construction per distinct bounds
+    return box(minx, miny, maxx, maxy)
+
+
+# Every datastore proxy walks its tile ids serially over the network, so
+# large data fetches are split across concurrent requests. This is the
+# default pool size; override with [threading] workers in datastores.ini.
+FETCH_DATA_THREADS = 8
+
+# Tile batches at least this large are masked in parallel; per-tile
+# masking is numpy C code that releases the GIL, so threads scale, but
+# smaller batches are not worth the dispatch overhead.
+MASK_PARALLEL_THRESHOLD = 32
+
+# Logging configuration is left to the application entry point;
+# configuring it at import time would clobber the host application's
+# logging setup and redo handler setup in every Spark worker import.
 logger = logging.getLogger("testing")
 
 
@@ -78,10 +99,91 @@ class NexusTileServiceException(Exception):
     pass
 
 
+class _TileIdCoalescer(object):
+    """
+    Batches concurrent single-id metadata lookups into one Solr query.
+
+    Lookups queue until either the collection window elapses or the batch
+    limit is reached, then a single terms query resolves every pending
+    future. Only useful when multiple threads look up ids concurrently;
+    see NexusTileService.coalesced().
+    """
+
+    def __init__(self, metadatastore, max_batch=200, window_seconds=0.005):
+        self._metadatastore = metadatastore
+        self._max_batch = max_batch
+        self._window = window_seconds
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._timer = None
+
+    def lookup(self, tile_id):
+        future = Future()
+        with self._lock:
+            self._pending.append((str(tile_id), future))
+            flush_now = len(self._pending) >= self._max_batch
+            if not flush_now and self._timer is None:
+                self._timer = threading.Timer(self._window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self.flush()
+        return future.result()
+
+    def flush(self):
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not pending:
+            return
+
+        distinct_ids = list(dict.fromkeys(tile_id for tile_id, _ in pending))
+        try:
+            docs = self._metadatastore.find_tiles_by_id(distinct_ids)
+        except Exception:
+            # The batch query fails as a whole when any one id is absent
+            # (find_tiles_by_id asserts it found every id), so retry the
+            # pending ids individually and fail only the lookups that
+            # actually fail on their own.
+            self._flush_individually(pending)
+            return
+
+        docs_by_id = {doc['id']: doc for doc in docs}
+        for tile_id, future in pending:
+            doc = docs_by_id.get(tile_id)
+            if doc is not None:
+                future.set_result([doc])
+            else:
+                future.set_exception(
+                    AssertionError("Found 0 results, expected exactly 1"))
+
+    def _flush_individually(self, pending):
+        results_by_id = {}
+        for tile_id, future in pending:
+            if tile_id not in results_by_id:
+                try:
+                    results_by_id[tile_id] = self._metadatastore.find_tile_by_id(tile_id)
+                except Exception as e:
+                    results_by_id[tile_id] = e
+            result = results_by_id[tile_id]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 class NexusTileService(object):
     def __init__(self, skipDatastore=False, skipMetadatastore=False, config=None):
         self._datastore = None
         self._metadatastore = None
+        self._fetch_pool = None
+        self._mask_pool = None
+        self._fetch_pool_lock = threading.Lock()
+        self._tile_id_coalescer = None
 
         self._config = configparser.RawConfigParser()
         self._config.read(NexusTileService._get_config_files('config/datastores.ini'))
@@ -89,6 +191,8 @@ class NexusTileService(object):
         if config:
             self.override_config(config)
 
+        self._fetch_pool_workers = self._config.getint('threading', 'workers', fallback=FETCH_DATA_THREADS)
+
         if not skipDatastore:
             datastore = self._config.get("datastore", "store")
             if datastore == "cassandra":
@@ -120,8 +224,35 @@ class NexusTileService(object):
         else:
             return self._metadatastore.get_data_series_list()
 
+    @contextmanager
+    def coalesced(self):
+        """
+        Batch concurrent find_tile_by_id metadata lookups issued while the
+        context is active into single Solr terms queries. Lookups from a
+        single thread gain nothing (each waits out the collection window),
+        so only enter this context around code that fans id lookups out
+        across threads.
+
+        No in-tree algorithm does that today: the Spark matchup and
+        difference algorithms call find_tile_by_id one id at a time from
+        single-threaded per-partition loops, where wrapping the loop in
+        this context would only add the collection window's latency. The
+        context is shipped for external callers and future threaded call
+        sites rather than wired into those loops.
+        """
+        coalescer = _TileIdCoalescer(self._metadatastore)
+        self._tile_id_coalescer = coalescer
+        try:
+            yield self
+        finally:
+            self._tile_id_coalescer = None
+            coalescer.flush()
+
     @tile_data()
     def find_tile_by_id(self, tile_id, **kwargs):
+        coalescer = self._tile_id_coalescer
+        if coalescer is not None:
+            return coalescer.lookup(tile_id)
         return self._metadatastore.find_tile_by_id(tile_id)
 
     @tile_data()
@@ -313,12 +444,26 @@ class NexusTileService(object):
         :param tile_ids: List of tile ids
         :return: shapely.geometry.Polygon that represents the smallest bounding box that encompasses all of the tiles
         """
-        tiles = self.find_tiles_by_id(tile_ids, fl=['tile_min_lat', 'tile_max_lat', 'tile_min_lon', 'tile_max_lon'],
-                                      fetch_data=False, rows=len(tile_ids))
-        polys = []
-        for tile in tiles:
-            polys.append(box(tile.bbox.min_lon, tile.bbox.min_lat, tile.bbox.max_lon, tile.bbox.max_lat))
-        return box(*MultiPolygon(polys).bounds)
+        columns = self._find_tile_columns(tile_ids,
+                                          ('tile_min_lon', 'tile_min_lat', 'tile_max_lon', 'tile_max_lat'))
+        return box(columns['tile_min_lon'].min(), columns['tile_min_lat'].min(),
+                   columns['tile_max_lon'].max(), columns['tile_max_lat'].max())
+
+    def _find_tile_columns(self, tile_ids, fields):
+        """
+        Columnar fast path for bulk reductions over tile metadata: fetch
+        only the given numeric fields for the tile ids, straight from the
+        metadata store docs, and return {field: np.ndarray} without
+        constructing Tile objects.
+        """
+        docs = self._metadatastore.find_tiles_by_id(tile_ids, fl=list(fields), rows=len(tile_ids))
+
+        columns = {}
+        for field in fields:
+            columns[field] = np.array(
+                [doc[field][0] if isinstance(doc[field], list) else doc[field] for doc in docs],
+                dtype=np.float64)
+        return columns
 
     def get_min_time(self, tile_ids, ds=None):
         """
@@ -350,50 +495,136 @@ class NexusTileService(object):
         :return: A list of distinct bounding boxes (as shapely polygons) for tiles in the search polygon
         """
         bounds = self._metadatastore.find_distinct_bounding_boxes_in_polygon(bounding_polygon, ds, start_time, end_time)
-        return [box(*b) for b in bounds]
+        return [_cached_box(*b) for b in bounds]
 
-    def mask_tiles_to_bbox(self, min_lat, max_lat, min_lon, max_lon, tiles):
-
-        for tile in tiles:
-            tile.latitudes = ma.masked_outside(tile.latitudes, min_lat, max_lat)
-            tile.longitudes = ma.masked_outside(tile.longitudes, min_lon, max_lon)
+    @staticmethod
+    def _coordinate_data_mask(time_mask, lat_mask, lon_mask, scratches=None):
+        # Single fused kernel shared by the mask_tiles_to_* variants:
+        # broadcast-OR the 1-D axis masks into the (time, lat, lon) data
+        # mask in one pass, with no per-axis 3-D intermediates. When a
+        # scratch pool is passed, same-shaped buffers reclaimed from
+        # dropped tiles are reused instead of allocating per tile.
+        time_mask = time_mask[:, np.newaxis, np.newaxis]
+        lat_mask = lat_mask[np.newaxis, :, np.newaxis]
+        lon_mask = lon_mask[np.newaxis, np.newaxis, :]
+
+        shape = (time_mask.shape[0], lat_mask.shape[1], lon_mask.shape[2])
+        scratch = scratches.pop(shape, None) if scratches is not None else None
+        if scratch is None:
+            return time_mask | lat_mask | lon_mask
+
+        np.logical_or(lat_mask, lon_mask, out=scratch)
+        scratch |= time_mask
+        return scratch
+
+    def _get_mask_pool(self):
+        with self._fetch_pool_lock:
+            if self._mask_pool is None:
+                self._mask_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4,
+                                                     thread_name_prefix='tile-mask')
+            return self._mask_pool
+
+    def _filter_masked_tiles(self, mask_one_tile, tiles):
+        # Masking is independent per tile and spends its time in numpy C
+        # code that releases the GIL, so large batches fan out across the
+        # shared mask pool; workers forgo the (per-call, single-threaded)
+        # scratch pool.
+        if len(tiles) >= MASK_PARALLEL_THRESHOLD:
+            pool = self._get_mask_pool()
+            kept_flags = list(pool.map(mask_one_tile, tiles))
+            tiles[:] = [tile for tile, kept in zip(tiles, kept_flags) if kept]
+        else:
+            mask_scratches = {}
+            tiles[:] = [tile for tile in tiles if mask_one_tile(tile, mask_scratches)]
+        return tiles
 
-            # Or together the masks of the individual arrays to create the new mask
-            data_mask = ma.getmaskarray(tile.times)[:, np.newaxis, np.newaxis] \
-                        | ma.getmaskarray(tile.latitudes)[np.newaxis, :, np.newaxis] \
-                        | ma.getmaskarray(tile.longitudes)[np.newaxis, np.newaxis, :]
+    def _mask_one_tile_bbox(self, tile, min_lat, max_lat, min_lon, max_lon, mask_scratches=None):
+        # Compare the raw coordinate values directly; masked_outside
+        # would allocate a masked-array intermediate per axis just to
+        # produce these boolean masks
+        lats = np.asarray(tile.latitudes)
+        lons = np.asarray(tile.longitudes)
+        lat_mask = ma.getmaskarray(tile.latitudes) | (lats < min_lat) | (lats > max_lat)
+        lon_mask = ma.getmaskarray(tile.longitudes) | (lons < min_lon) | (lons > max_lon)
+        tile.latitudes = ma.array(lats, mask=lat_mask)
+        tile.longitudes = ma.array(lons, mask=lon_mask)
+
+        # Or together the masks of the individual arrays to create the new mask
+        data_mask = self._coordinate_data_mask(ma.getmaskarray(tile.times), lat_mask, lon_mask,
+                                               scratches=mask_scratches)
+
+        # If this is multi-var, need to mask each variable separately.
+        if tile.is_multi:
+            # Combine space/time mask with existing mask on data;
+            # nomask means there is nothing to fold in
+            existing_mask = ma.getmask(tile.data[0])
+            if existing_mask is not ma.nomask:
+                data_mask |= existing_mask
+            if data_mask.all():
+                # Entirely masked; skip building the per-variable mask
+                # and let the next same-shaped tile reuse the buffer
+                if mask_scratches is not None:
+                    mask_scratches[data_mask.shape] = data_mask
+                return False
+
+            num_vars = len(tile.data)
+            multi_data_mask = np.broadcast_to(data_mask, (num_vars,) + data_mask.shape)
+            tile.data = ma.masked_where(multi_data_mask, tile.data)
+            if tile.data.mask.all():
+                return False
+        else:
+            existing_mask = ma.getmask(tile.data)
+            if existing_mask is not ma.nomask:
+                data_mask |= existing_mask
+            if data_mask.all():
+                if mask_scratches is not None:
+                    mask_scratches[data_mask.shape] = data_mask
+                return False
+            tile.data = ma.masked_where(data_mask, tile.data)
 
-            # If this is multi-var, need to mask each variable separately.
-            if tile.is_multi:
-                # Combine space/time mask with existing mask on data
-                data_mask = reduce(np.logical_or, [tile.data[0].mask, data_mask])
+        return True
 
-                num_vars = len(tile.data)
-                multi_data_mask = np.repeat(data_mask[np.newaxis, ...], num_vars, axis=0)
-                tile.data = ma.masked_where(multi_data_mask, tile.data)
-            else:
-                tile.data = ma.masked_where(data_mask, tile.data)
+    def mask_tiles_to_bbox(self, min_lat, max_lat, min_lon, max_lon, tiles):
 
-        tiles[:] = [tile for tile in tiles if not tile.data.mask.all()]
+        def mask_one_tile(tile, mask_scratches=None):
+            return self._mask_one_tile_bbox(tile, min_lat, max_lat, min_lon, max_lon, mask_scratches)
+
+        return self._filter_masked_tiles(mask_one_tile, tiles)
+
+    def _mask_one_tile_bbox_and_time(self, tile, min_lat, max_lat, min_lon, max_lon, start_time, end_time,
+                                     mask_scratches=None):
+        times = np.asarray(tile.times)
+        lats = np.asarray(tile.latitudes)
+        lons = np.asarray(tile.longitudes)
+        time_mask = ma.getmaskarray(tile.times) | (times < start_time) | (times > end_time)
+        lat_mask = ma.getmaskarray(tile.latitudes) | (lats < min_lat) | (lats > max_lat)
+        lon_mask = ma.getmaskarray(tile.longitudes) | (lons < min_lon) | (lons > max_lon)
+        tile.times = ma.array(times, mask=time_mask)
+        tile.latitudes = ma.array(lats, mask=lat_mask)
+        tile.longitudes = ma.array(lons, mask=lon_mask)
+
+        # Or together the masks of the individual arrays to create the new mask
+        data_mask = self._coordinate_data_mask(time_mask, lat_mask, lon_mask,
+                                               scratches=mask_scratches)
+
+        existing_mask = ma.getmask(tile.data)
+        if existing_mask is not ma.nomask:
+            data_mask |= existing_mask
+        if data_mask.all():
+            if mask_scratches is not None:
+                mask_scratches[data_mask.shape] = data_mask
+            return False
+        tile.data = ma.masked_where(data_mask, tile.data)
 
-        return tiles
+        return True
 
     def mask_tiles_to_bbox_and_time(self, min_lat, max_lat, min_lon, max_lon, start_time, end_time, tiles):
-        for tile in tiles:
-            tile.times = ma.masked_outside(tile.times, start_time, end_time)
-            tile.latitudes = ma.masked_outside(tile.latitudes, min_lat, max_lat)
-            tile.longitudes = ma.masked_outside(tile.longitudes, min_lon, max_lon)
-
-            # Or together the masks of the individual arrays to create the new mask
-            data_mask = ma.getmaskarray(tile.times)[:, np.newaxis, np.newaxis] \
-                        | ma.getmaskarray(tile.latitudes)[np.newaxis, :, np.newaxis] \
-                        | ma.getmaskarray(tile.longitudes)[np.newaxis, np.newaxis, :]
-
-            tile.data = ma.masked_where(data_mask, tile.data)
 
-        tiles[:] = [tile for tile in tiles if not tile.data.mask.all()]
+        def mask_one_tile(tile, mask_scratches=None):
+            return self._mask_one_tile_bbox_and_time(tile, min_lat, max_lat, min_lon, max_lon,
+                                                     start_time, end_time, mask_scratches)
 
-        return tiles
+        return self._filter_masked_tiles(mask_one_tile, tiles)
 
     def mask_tiles_to_polygon(self, bounding_polygon, tiles):
 
@@ -415,19 +646,47 @@ class NexusTileService(object):
         :return: A list tiles with data masked to specified time range
         """
         if 0 <= start_time <= end_time:
-            for tile in tiles:
-                tile.times = ma.masked_outside(tile.times, start_time, end_time)
+            def mask_one_tile(tile, mask_scratches=None):
+                return self._mask_one_tile_time_range(tile, start_time, end_time, mask_scratches)
 
-                # Or together the masks of the individual arrays to create the new mask
-                data_mask = ma.getmaskarray(tile.times)[:, np.newaxis, np.newaxis] \
-                            | ma.getmaskarray(tile.latitudes)[np.newaxis, :, np.newaxis] \
-                            | ma.getmaskarray(tile.longitudes)[np.newaxis, np.newaxis, :]
+            self._filter_masked_tiles(mask_one_tile, tiles)
 
-                tile.data = ma.masked_where(data_mask, tile.data)
+        return tiles
 
-            tiles[:] = [tile for tile in tiles if not tile.data.mask.all()]
+    def _mask_one_tile_time_range(self, tile, start_time, end_time, mask_scratches=None):
+        times = np.asarray(tile.times)
+        # Tile time axes are almost always sorted; when they are,
+        # two binary searches find the in-range slice instead of
+        # comparing every element against both bounds. Checking
+        # sortedness is a single cheap pass. Don't cache the result on
+        # the tile: Tile.get_summary() reflects the instance __dict__,
+        # so extra attributes would leak into API responses.
+        if np.all(times[:-1] <= times[1:]):
+            time_mask = np.ones(times.shape, dtype=bool)
+            lo = np.searchsorted(times, start_time, 'left')
+            hi = np.searchsorted(times, end_time, 'right')
+            time_mask[lo:hi] = False
+            time_mask |= ma.getmaskarray(tile.times)
+        else:
+            time_mask = ma.getmaskarray(tile.times) | (times < start_time) | (times > end_time)
+        tile.times = ma.array(times, mask=time_mask)
+
+        # Or together the masks of the individual arrays to create the new mask
+        data_mask = self._coordinate_data_mask(time_mask,
+                                               ma.getmaskarray(tile.latitudes),
+                                               ma.getmaskarray(tile.longitudes),
+                                               scratches=mask_scratches)
+
+        existing_mask = ma.getmask(tile.data)
+        if existing_mask is not ma.nomask:
+            data_mask |= existing_mask
+        if data_mask.all():
+            if mask_scratches is not None:
+                mask_scratches[data_mask.shape] = data_mask
+            return False
+        tile.data = ma.masked_where(data_mask, tile.data)
 
-        return tiles
+        return True
 
     def get_tile_count(self, ds, bounding_polygon=None, start_time=0, end_time=-1, metadata=None, **kwargs):
         """
@@ -441,12 +700,32 @@ class NexusTileService(object):
         """
         return self._metadatastore.get_tile_count(ds, bounding_polygon, start_time, end_time, metadata, **kwargs)
 
+    def _get_fetch_pool(self):
+        with self._fetch_pool_lock:
+            if self._fetch_pool is None:
+                self._fetch_pool = ThreadPoolExecutor(max_workers=self._fetch_pool_workers,
+                                                      thread_name_prefix='tile-fetch')
+            return self._fetch_pool
+
     def fetch_data_for_tiles(self, *tiles):
 
         nexus_tile_ids = set([tile.tile_id for tile in tiles])
-        matched_tile_data = self._datastore.fetch_nexus_tiles(*nexus_tile_ids)
 
-        tile_data_by_id = {str(a_tile_data.tile_id): a_tile_data for a_tile_data in matched_tile_data}
+        tile_data_by_id = {}
+        if len(nexus_tile_ids) > 1:
+            # Interleave the ids across chunks and fetch them concurrently,
+            # filling tile_data_by_id as each chunk completes
+            id_list = list(nexus_tile_ids)
+            num_chunks = min(self._fetch_pool_workers, len(id_list))
+            chunks = [id_list[i::num_chunks] for i in range(num_chunks)]
+            pool = self._get_fetch_pool()
+            futures = [pool.submit(self._datastore.fetch_nexus_tiles, *chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for a_tile_data in future.result():
+                    tile_data_by_id[str(a_tile_data.tile_id)] = a_tile_data
+        else:
+            matched_tile_data = self._datastore.fetch_nexus_tiles(*nexus_tile_ids)
+            tile_data_by_id = {str(a_tile_data.tile_id): a_tile_data for a_tile_data in matched_tile_data}
 
         missing_data = nexus_tile_ids.difference(list(tile_data_by_id.keys()))
         if len(missing_data) > 0:
@@ -468,20 +747,26 @@ class NexusTileService(object):
 
     def _metadata_store_docs_to_tiles(self, *store_docs):
 
+        # Parse all timestamps in two vectorized passes; datetime64 is an
+        # order of magnitude faster than per-doc strptime. Docs without a
+        # time field parse as NaT and are skipped below.
+        min_times = np.array([store_doc.get('tile_min_time_dt', '').rstrip('Z') for store_doc in store_docs],
+                             dtype='datetime64[s]').tolist()
+        max_times = np.array([store_doc.get('tile_max_time_dt', '').rstrip('Z') for store_doc in store_docs],
+                             dtype='datetime64[s]').tolist()
+
         tiles = []
-        for store_doc in store_docs:
+        for doc_index, store_doc in enumerate(store_docs):
             tile = Tile()
-            try:
-                tile.tile_id = store_doc['id']
-            except KeyError:
-                pass
-
-            try:
-                min_lat = store_doc['tile_min_lat']
-                min_lon = store_doc['tile_min_lon']
-                max_lat = store_doc['tile_max_lat']
-                max_lon = store_doc['tile_max_lon']
-
+            tile_id = store_doc.get('id')
+            if tile_id is not None:
+                tile.tile_id = tile_id
+
+            min_lat = store_doc.get('tile_min_lat')
+            min_lon = store_doc.get('tile_min_lon')
+            max_lat = store_doc.get('tile_max_lat')
+            max_lon = store_doc.get('tile_max_lon')
+            if min_lat is not None and min_lon is not None and max_lat is not None and max_lon is not None:
                 if isinstance(min_lat, list):
                     min_lat = min_lat[0]
                 if isinstance(min_lon, list):
@@ -492,59 +777,49 @@ class NexusTileService(object):
                     max_lon = max_lon[0]
 
                 tile.bbox = BBox(min_lat, max_lat, min_lon, max_lon)
-            except KeyError:
-                pass
 
-            try:
-                tile.dataset = store_doc['dataset_s']
-            except KeyError:
-                pass
+            dataset = store_doc.get('dataset_s')
+            if dataset is not None:
+                tile.dataset = dataset
 
-            try:
-                tile.dataset_id = store_doc['dataset_id_s']
-            except KeyError:
-                pass
+            dataset_id = store_doc.get('dataset_id_s')
+            if dataset_id is not None:
+                tile.dataset_id = dataset_id
 
-            try:
-                tile.granule = store_doc['granule_s']
-            except KeyError:
-                pass
+            granule = store_doc.get('granule_s')
+            if granule is not None:
+                tile.granule = granule
 
-            try:
-                tile.min_time = datetime.strptime(store_doc['tile_min_time_dt'], "%Y-%m-%dT%H:%M:%SZ").replace(
-                    tzinfo=UTC)
-            except KeyError:
-                pass
+            min_time = min_times[doc_index]
+            if min_time is not None:
+                tile.min_time = min_time.replace(tzinfo=UTC)
 
-            try:
-                tile.max_time = datetime.strptime(store_doc['tile_max_time_dt'], "%Y-%m-%dT%H:%M:%SZ").replace(
-                    tzinfo=UTC)
-            except KeyError:
-                pass
+            max_time = max_times[doc_index]
+            if max_time is not None:
+                tile.max_time = max_time.replace(tzinfo=UTC)
 
-            try:
-                tile.section_spec = store_doc['sectionSpec_s']
-            except KeyError:
-                pass
+            section_spec = store_doc.get('sectionSpec_s')
+            if section_spec is not None:
+                tile.section_spec = section_spec
 
-            try:
+            if ('tile_min_val_d' in store_doc and 'tile_max_val_d' in store_doc
+                    and 'tile_avg_val_d' in store_doc and 'tile_count_i' in store_doc):
                 tile.tile_stats = TileStats(
                     store_doc['tile_min_val_d'], store_doc['tile_max_val_d'],
                     store_doc['tile_avg_val_d'], store_doc['tile_count_i']
                 )
-            except KeyError:
-                pass
 
-            try:
+            var_name_s = store_doc.get('tile_var_name_s')
+            if var_name_s is not None:
                 # Ensure backwards compatibility by working with old
                 # tile_var_name_s and tile_standard_name_s fields to
 
                 # will be overwritten if tile_var_name_ss is present
                 # as well.
-                if '[' in store_doc['tile_var_name_s']:
-                    var_names = json.loads(store_doc['tile_var_name_s'])
+                if '[' in var_name_s:
+                    var_names = json.loads(var_name_s)
                 else:
-                    var_names = [store_doc['tile_var_name_s']]
+                    var_names = [var_name_s]
 
                 standard_name = store_doc.get(
                         'tile_standard_name_s',
@@ -561,9 +836,6 @@ class NexusTileService(object):
                         variable_name=var_name,
                         standard_name=standard_name
                     ))
-            except KeyError:
-                pass
-
 
             if 'tile_var_name_ss' in store_doc:
                 tile.variables = []
@@ -587,7 +859,11 @@ class NexusTileService(object):
             return False
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _get_config_files(filename):
+        # pkg_resources.resource_filename rescans the working set on every
+        # call, so cache the resolved paths; they cannot change within a
+        # process lifetime
         log = logging.getLogger(__name__)
         candidates = []
         extensions = ['.default', '']
@@ -599,4 +875,4 @@ class NexusTileService(object):
             except KeyError as ke:
                 log.warning('configuration file {} not found'.format(filename + extension))
 
-        return candidates
+        return tuple(candidates)